@@ -1,9 +1,9 @@
 """Advanced example: Concurrent batch processing with LeapOCR.
 
 This example demonstrates:
-- Processing multiple documents concurrently
-- Using asyncio.gather for parallel processing
-- Tracking results and errors
+- Submitting multiple documents concurrently with process_batch()
+- Waiting for the submitted jobs on one shared polling schedule
+- Tracking results and errors per input document
 - Calculating total credits used
 
 Requirements:
@@ -13,30 +13,7 @@ Requirements:
 import asyncio
 import os
 
-from leapocr import JobResult, LeapOCR, PollOptions
-
-
-async def process_document(
-    client: LeapOCR, url: str, document_id: int
-) -> tuple[int, JobResult | None, Exception | None]:
-    """Process a single document and return results or error."""
-    try:
-        print(f"[{document_id}] Starting processing: {url}")
-
-        result = await client.ocr.process_and_wait(
-            url,
-            poll_options=PollOptions(poll_interval=2.0, max_wait=180.0),
-        )
-
-        print(
-            f"[{document_id}] ✓ Completed - {len(result.pages)} pages, "
-            f"{result.credits_used} credits"
-        )
-        return document_id, result, None
-
-    except Exception as error:
-        print(f"[{document_id}] ✗ Failed: {error}")
-        return document_id, None, error
+from leapocr import JobError, JobResult, LeapOCR, PollOptions, install_uvloop
 
 
 async def main():
@@ -58,21 +35,43 @@ async def main():
     print()
 
     async with LeapOCR(api_key) as client:
-        # Process all documents concurrently
-        tasks = [process_document(client, url, i + 1) for i, url in enumerate(documents)]
-
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-
-        # Analyze results
         successful: list[tuple[int, JobResult]] = []
-        failed: list[tuple[int, Exception]] = []
+        failed: list[tuple[int, str]] = []
+
+        # Phase 1: submit everything (quick POSTs), at most 8 at a time. Failed
+        # submissions come back as exceptions at their document's position.
+        submissions = await client.ocr.process_batch(
+            documents, max_concurrent=8, return_exceptions=True
+        )
 
-        for doc_id, result, error in results:
-            if error:
-                failed.append((doc_id, error))
-            elif result:
+        jobs: dict[str, int] = {}
+        for doc_id, submission in enumerate(submissions, start=1):
+            if isinstance(submission, Exception):
+                print(f"[{doc_id}] ✗ Submission failed: {submission}")
+                failed.append((doc_id, str(submission)))
+            else:
+                print(f"[{doc_id}] Submitted: {documents[doc_id - 1]} -> {submission.job_id}")
+                jobs[submission.job_id] = doc_id
+
+        # Phase 2: wait for the submitted jobs, handling each as it finishes.
+        # Polling is bounded separately, so no submission slot is held while
+        # a job is processing.
+        try:
+            async for result in client.ocr.iter_results(
+                list(jobs), PollOptions(poll_interval=2.0, max_wait=180.0)
+            ):
+                doc_id = jobs.pop(result.job_id)
+                print(
+                    f"[{doc_id}] ✓ Completed - {len(result.pages)} pages, "
+                    f"{result.credits_used} credits"
+                )
                 successful.append((doc_id, result))
+        except JobError as error:
+            # A failed or timed-out job stops the wait; report what is left
+            for job_id, doc_id in jobs.items():
+                reason = str(error) if job_id == error.job_id else "not finished when wait stopped"
+                print(f"[{doc_id}] ✗ {reason}")
+                failed.append((doc_id, reason))
 
         # Print summary
         print("\n" + "=" * 50)
@@ -91,9 +90,11 @@ async def main():
 
         if failed:
             print("\nFailed documents:")
-            for doc_id, error in failed:
+            for doc_id, error in sorted(failed, key=lambda item: item[0]):
                 print(f"  [{doc_id}] {error}")
 
 
 if __name__ == "__main__":
+    # Faster event loop for many concurrent requests (pip install leapocr[uvloop])
+    install_uvloop()
     asyncio.run(main())
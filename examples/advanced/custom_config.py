@@ -1,7 +1,7 @@
 """Advanced example: Custom configuration and polling options.
 
 This example demonstrates:
-- Custom client configuration (timeout, base URL, retries)
+- Custom client configuration (timeout, base URL, retries, HTTP/2)
 - Custom polling options with progress callbacks
 - Different output formats
 
@@ -10,6 +10,7 @@ Requirements:
 """
 
 import asyncio
+import importlib.util
 import os
 
 from leapocr import Format, LeapOCR, Model, PollOptions, ProcessOptions
@@ -32,6 +33,10 @@ async def main():
         max_retries=5,  # More retries for reliability
         retry_delay=2.0,  # Start with 2 second delay
         retry_multiplier=2.0,  # Exponential backoff
+        prewarm=True,  # Open a connection as soon as the client is entered
+        # Multiplex status polls for many jobs over one connection
+        # (pip install leapocr[http2])
+        http2=importlib.util.find_spec("h2") is not None,
     )
 
     print("Custom configuration:")
@@ -40,6 +45,7 @@ async def main():
     print(f"  Max retries: {config.max_retries}")
     print(f"  Retry delay: {config.retry_delay}s")
     print(f"  Retry multiplier: {config.retry_multiplier}x")
+    print(f"  HTTP/2: {'enabled' if config.http2 else 'disabled (h2 not installed)'}")
     print()
 
     # Example document
@@ -46,7 +46,8 @@ async def main():
             ]:
                 break
 
-            await asyncio.sleep(2)
+            # Honor the server's suggested poll interval when it sends one
+            await asyncio.sleep(status.retry_after or 2)
 
         print()
 
@@ -6,8 +6,9 @@ by their slug instead of defining schema and instructions inline.
 
 import asyncio
 import os
+from typing import Union
 
-from leapocr import LeapOCR, ProcessOptions
+from leapocr import JobResult, LeapOCR, ProcessOptions, install_uvloop
 
 
 async def main():
@@ -42,18 +43,33 @@ async def main():
             "https://example.com/invoice3.pdf",
         ]
 
-        # Submit all jobs
-        jobs = await asyncio.gather(
-            *[
-                client.ocr.process_url(
-                    url, options=ProcessOptions(template_slug="invoice-extraction")
-                )
-                for url in files
-            ]
-        )
-
-        # Wait for all to complete
-        results = await asyncio.gather(*[client.ocr.wait_until_done(job.job_id) for job in jobs])
+        # Cap in-flight jobs so large file lists don't open one connection
+        # per URL and trip the API rate limits
+        max_concurrent = 8
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def process_bounded(url: str) -> tuple[str, Union[JobResult, Exception]]:
+            # Return the URL alongside the outcome: as_completed() yields in
+            # completion order, so failures can't be matched to inputs otherwise
+            async with semaphore:
+                try:
+                    job = await client.ocr.process_url(
+                        url, options=ProcessOptions(template_slug="invoice-extraction")
+                    )
+                    return url, await client.ocr.wait_until_done(job.job_id)
+                except Exception as e:
+                    return url, e
+
+        # Handle each result as soon as its job finishes instead of waiting
+        # for the slowest document in the batch
+        results: list[JobResult] = []
+        for next_done in asyncio.as_completed([process_bounded(url) for url in files]):
+            url, result = await next_done
+            if isinstance(result, Exception):
+                print(f"✗ {url}: {result}")
+                continue
+            results.append(result)
+            print(f"  • {result.file_name}: {result.total_pages} pages")
 
         print(f"✓ Processed {len(results)} documents")
         total_credits = sum(r.credits_used for r in results)
@@ -80,4 +96,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Faster event loop for many concurrent requests (pip install leapocr[uvloop])
+    install_uvloop()
     asyncio.run(main())
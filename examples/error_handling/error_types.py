@@ -66,7 +66,7 @@ async def test_job_error(api_key: str):
         except (JobError, APIError, LeapOCRError) as e:
             print(f"   ✓ Caught error: {type(e).__name__}")
             print(f"     Message: {e.message}")
-            if hasattr(e, "status_code") and e.status_code:
+            if e.status_code:
                 print(f"     HTTP Status: {e.status_code}")
         print()
 
@@ -115,13 +115,14 @@ async def test_error_inspection(api_key: str):
             print(f"     Message: {e.message}")
             print(f"     Code: {e.code}")
 
-            if hasattr(e, "status_code") and e.status_code:
+            if e.status_code:
                 print(f"     HTTP Status: {e.status_code}")
 
-            if hasattr(e, "response") and e.response:
+            # Subclass-specific attributes: narrow with isinstance
+            if isinstance(e, APIError) and e.response:
                 print(f"     Response: {e.response[:100]}...")
 
-            if hasattr(e, "field") and e.field:
+            if isinstance(e, ValidationError) and e.field:
                 print(f"     Field: {e.field}")
 
             # Check if error has a cause
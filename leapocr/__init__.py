@@ -15,52 +15,118 @@ Example:
     >>> asyncio.run(main())
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.0.4"
 
-# Core client
-from .client import LeapOCR
-
-# Configuration
-from .config import ClientConfig
-
-# Errors
-from .errors import (
-    APIError,
-    AuthenticationError,
-    FileError,
-    InsufficientCreditsError,
-    JobError,
-    JobFailedError,
-    JobTimeoutError,
-    LeapOCRError,
-    NetworkError,
-    RateLimitError,
-    ValidationError,
-)
-
-# Models and enums
-from .models import (
-    BatchResult,
-    Format,
-    JobResult,
-    JobStatus,
-    JobStatusType,
-    Model,
-    ModelInfo,
-    PageResult,
-    PaginationInfo,
-    PollOptions,
-    ProcessOptions,
-    ProcessResult,
-)
+if TYPE_CHECKING:
+    # Event loop helpers
+    from ._internal.event_loop import install_uvloop
+
+    # Caching
+    from .cache import DiskCache, MemoryCache, ResultCache
+
+    # Core client
+    from .client import LeapOCR
+
+    # Configuration
+    from .config import ClientConfig
+
+    # Errors
+    from .errors import (
+        APIError,
+        AuthenticationError,
+        FileError,
+        InsufficientCreditsError,
+        JobError,
+        JobFailedError,
+        JobTimeoutError,
+        LeapOCRError,
+        NetworkError,
+        RateLimitError,
+        ValidationError,
+    )
+
+    # Models and enums
+    from .models import (
+        BatchResult,
+        Format,
+        JobResult,
+        JobStatus,
+        JobStatusType,
+        Model,
+        ModelInfo,
+        PageResult,
+        PaginationInfo,
+        PollOptions,
+        ProcessOptions,
+        ProcessResult,
+    )
+
+# Public names are imported on first access (PEP 562) so that ``import leapocr``
+# does not pull in httpx and the rest of the SDK until they are used.
+_LAZY_IMPORTS = {
+    "DiskCache": ".cache",
+    "MemoryCache": ".cache",
+    "ResultCache": ".cache",
+    "LeapOCR": ".client",
+    "install_uvloop": "._internal.event_loop",
+    "ClientConfig": ".config",
+    "APIError": ".errors",
+    "AuthenticationError": ".errors",
+    "FileError": ".errors",
+    "InsufficientCreditsError": ".errors",
+    "JobError": ".errors",
+    "JobFailedError": ".errors",
+    "JobTimeoutError": ".errors",
+    "LeapOCRError": ".errors",
+    "NetworkError": ".errors",
+    "RateLimitError": ".errors",
+    "ValidationError": ".errors",
+    "BatchResult": ".models",
+    "Format": ".models",
+    "JobResult": ".models",
+    "JobStatus": ".models",
+    "JobStatusType": ".models",
+    "Model": ".models",
+    "ModelInfo": ".models",
+    "PageResult": ".models",
+    "PaginationInfo": ".models",
+    "PollOptions": ".models",
+    "ProcessOptions": ".models",
+    "ProcessResult": ".models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Version
     "__version__",
     # Client
     "LeapOCR",
+    "install_uvloop",
     # Configuration
     "ClientConfig",
+    # Caching
+    "ResultCache",
+    "MemoryCache",
+    "DiskCache",
     # Models
     "Format",
     "Model",
@@ -0,0 +1,32 @@
+"""Optional event loop setup for LeapOCR SDK.
+
+Kept separate from the other internal helpers so that calling
+``leapocr.install_uvloop()`` before ``asyncio.run()`` does not import httpx.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop implementation if it is installed.
+
+    uvloop reduces per-await overhead for workloads with many concurrent
+    uploads and status polls. Call this before ``asyncio.run()``; it has no
+    effect on an event loop that is already running. The event loop policy is
+    set directly because ``uvloop.install()`` is deprecated on Python 3.12+.
+    ``asyncio.set_event_loop_policy()`` is itself deprecated from Python 3.14
+    (policies are slated for removal in 3.16); there, prefer
+    ``asyncio.run(main(), loop_factory=uvloop.new_event_loop)``.
+
+    Returns:
+        True if uvloop was installed, False if it is not available
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
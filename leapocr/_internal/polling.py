@@ -3,16 +3,67 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable
-from datetime import datetime, timedelta
+import inspect
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterable
 from typing import TYPE_CHECKING, Callable
 
 from ..errors import JobFailedError, JobTimeoutError
-from ..models import JobStatusType, PollOptions
+from ..models import JobStatusType, PollOptions, ProgressCallback
+from .utils import gather_or_cancel
 
 if TYPE_CHECKING:
     from ..models import JobStatus
 
+# Bound once so the per-status checks skip the enum class attribute lookup
+_COMPLETED = JobStatusType.COMPLETED
+_FAILED = JobStatusType.FAILED
+
+# Shared defaults for callers that pass no options; only ever read, never mutated
+DEFAULT_POLL_OPTIONS = PollOptions()
+
+
+async def _sleep_until_deadline(delay: float, deadline: float) -> None:
+    """Sleep for ``delay`` seconds, but never past the polling deadline.
+
+    Without the clamp a long poll interval or Retry-After hint can overshoot
+    max_wait, so the caller's timeout would only fire a full interval late.
+    """
+    remaining = deadline - time.monotonic()
+    await asyncio.sleep(max(min(delay, remaining), 0.0))
+
+
+async def _notify_progress(options: PollOptions, status: JobStatus) -> None:
+    """Invoke the progress callback, awaiting it if it is a coroutine function.
+
+    Async callbacks let progress reporting do I/O (e.g. update a database or
+    send a websocket message) without blocking the event loop.
+    """
+    if options.on_progress is None:
+        return
+    try:
+        result = options.on_progress(status)
+        if inspect.isawaitable(result):
+            await result
+    except Exception:
+        # Don't let callback errors stop polling
+        pass
+
+
+def _jittered(interval: float, options: PollOptions) -> float:
+    """Add up to ``jitter * interval`` of random delay.
+
+    Spreads out polls from jobs submitted together so they don't hit the API
+    in lockstep.
+    """
+    return interval + random.uniform(0, interval * options.jitter)
+
+
+def _next_interval(interval: float, options: PollOptions) -> float:
+    """Grow the poll interval exponentially, capped at max_interval."""
+    return max(interval, min(interval * options.backoff_multiplier, options.max_interval))
+
 
 async def poll_until_done(
     get_status_fn: Callable[[str], Awaitable[JobStatus]],
@@ -21,6 +72,10 @@ async def poll_until_done(
 ) -> None:
     """Poll job status until completion or failure.
 
+    The first poll waits ``poll_interval`` seconds; each subsequent wait grows
+    by ``backoff_multiplier`` up to ``max_interval``, so long-running jobs are
+    checked less often.
+
     Args:
         get_status_fn: Async function to get job status (takes job_id, returns JobStatus)
         job_id: Job ID to poll
@@ -30,14 +85,14 @@ async def poll_until_done(
         JobTimeoutError: If job doesn't complete within max_wait
         JobFailedError: If job processing fails
     """
-    opts = options or PollOptions()
-    start_time = datetime.now()
-    max_wait_td = timedelta(seconds=opts.max_wait)
+    opts = options or DEFAULT_POLL_OPTIONS
+    # Monotonic deadline: one float comparison per poll and immune to wall-clock jumps
+    deadline = time.monotonic() + opts.max_wait
+    interval = opts.poll_interval
 
     while True:
         # Check timeout
-        elapsed = datetime.now() - start_time
-        if elapsed > max_wait_td:
+        if time.monotonic() >= deadline:
             raise JobTimeoutError(
                 f"Job {job_id} did not complete within {opts.max_wait} seconds",
                 job_id=job_id,
@@ -47,24 +102,24 @@ async def poll_until_done(
         status = await get_status_fn(job_id)
 
         # Call progress callback if provided
-        if opts.on_progress:
-            try:
-                opts.on_progress(status)
-            except Exception:
-                # Don't let callback errors stop polling
-                pass
+        await _notify_progress(opts, status)
 
         # Check if job is complete
-        if status.status == JobStatusType.COMPLETED:
+        state = status.status
+        if state == _COMPLETED:
             return
 
         # Check if job failed
-        if status.status == JobStatusType.FAILED:
+        if state == _FAILED:
             error_msg = status.error_message or "Job processing failed"
             raise JobFailedError(error_msg, job_id=job_id, error_details=status.error_message)
 
-        # Wait before next poll
-        await asyncio.sleep(opts.poll_interval)
+        # Wait before next poll, honoring the server's Retry-After hint
+        if status.retry_after is not None:
+            await _sleep_until_deadline(status.retry_after, deadline)
+        else:
+            await _sleep_until_deadline(_jittered(interval, opts), deadline)
+            interval = _next_interval(interval, opts)
 
 
 async def poll_with_backoff(
@@ -74,7 +129,7 @@ async def poll_with_backoff(
     max_interval: float = 30.0,
     backoff_multiplier: float = 1.5,
     max_wait: float = 300.0,
-    on_progress: Callable[[JobStatus], None] | None = None,
+    on_progress: ProgressCallback | None = None,
 ) -> None:
     """Poll job status with exponential backoff.
 
@@ -94,40 +149,101 @@ async def poll_with_backoff(
         JobTimeoutError: If job doesn't complete within max_wait
         JobFailedError: If job processing fails
     """
-    start_time = datetime.now()
-    max_wait_td = timedelta(seconds=max_wait)
-    current_interval = initial_interval
+    options = PollOptions(
+        poll_interval=initial_interval,
+        max_wait=max_wait,
+        on_progress=on_progress,
+        backoff_multiplier=backoff_multiplier,
+        max_interval=max_interval,
+    )
+    await poll_until_done(get_status_fn, job_id, options)
 
-    while True:
+
+async def iter_completed(
+    get_status_fn: Callable[[str], Awaitable[JobStatus]],
+    job_ids: Iterable[str],
+    options: PollOptions | None = None,
+) -> AsyncIterator[str]:
+    """Poll several jobs on a shared schedule, yielding each job ID as it completes.
+
+    Each tick checks every in-flight job concurrently and then sleeps once,
+    so N jobs cost one wait per tick rather than N independent poll loops.
+    Completed jobs are yielded immediately and dropped from subsequent ticks.
+    The tick interval backs off like poll_until_done().
+
+    Args:
+        get_status_fn: Async function to get job status (takes job_id, returns JobStatus)
+        job_ids: Job IDs to poll
+        options: Polling options (interval, timeout, callbacks)
+
+    Yields:
+        Job IDs in completion order
+
+    Raises:
+        JobTimeoutError: If any job doesn't complete within max_wait
+        JobFailedError: If any job processing fails
+    """
+    opts = options or DEFAULT_POLL_OPTIONS
+    # Monotonic deadline: one float comparison per poll and immune to wall-clock jumps
+    deadline = time.monotonic() + opts.max_wait
+    pending = list(dict.fromkeys(job_ids))
+    interval = opts.poll_interval
+
+    while pending:
         # Check timeout
-        elapsed = datetime.now() - start_time
-        if elapsed > max_wait_td:
+        if time.monotonic() >= deadline:
             raise JobTimeoutError(
-                f"Job {job_id} did not complete within {max_wait} seconds",
-                job_id=job_id,
+                f"Job {pending[0]} did not complete within {opts.max_wait} seconds",
+                job_id=pending[0],
             )
 
-        # Get current status
-        status = await get_status_fn(job_id)
+        statuses = await gather_or_cancel(*(get_status_fn(job_id) for job_id in pending))
 
-        # Call progress callback if provided
-        if on_progress:
-            try:
-                on_progress(status)
-            except Exception:
-                pass
+        still_pending: list[str] = []
+        completed: list[str] = []
+        delay = _jittered(interval, opts)
+        for job_id, status in zip(pending, statuses):
+            # Call progress callback if provided
+            await _notify_progress(opts, status)
 
-        # Check if job is complete
-        if status.status == JobStatusType.COMPLETED:
-            return
+            state = status.status
+            if state == _COMPLETED:
+                completed.append(job_id)
+                continue
 
-        # Check if job failed
-        if status.status == JobStatusType.FAILED:
-            error_msg = status.error_message or "Job processing failed"
-            raise JobFailedError(error_msg, job_id=job_id, error_details=status.error_message)
+            if state == _FAILED:
+                error_msg = status.error_message or "Job processing failed"
+                raise JobFailedError(error_msg, job_id=job_id, error_details=status.error_message)
+
+            still_pending.append(job_id)
+            # Honor the longest Retry-After hint among the jobs still running
+            if status.retry_after is not None:
+                delay = max(delay, status.retry_after)
 
-        # Wait with current interval
-        await asyncio.sleep(current_interval)
+        for job_id in completed:
+            yield job_id
 
-        # Increase interval for next iteration (exponential backoff)
-        current_interval = min(current_interval * backoff_multiplier, max_interval)
+        pending = still_pending
+        if pending:
+            await _sleep_until_deadline(delay, deadline)
+            interval = _next_interval(interval, opts)
+
+
+async def poll_many_until_done(
+    get_status_fn: Callable[[str], Awaitable[JobStatus]],
+    job_ids: Iterable[str],
+    options: PollOptions | None = None,
+) -> None:
+    """Poll several jobs on a shared schedule until all of them complete.
+
+    Args:
+        get_status_fn: Async function to get job status (takes job_id, returns JobStatus)
+        job_ids: Job IDs to poll
+        options: Polling options (interval, timeout, callbacks)
+
+    Raises:
+        JobTimeoutError: If any job doesn't complete within max_wait
+        JobFailedError: If any job processing fails
+    """
+    async for _ in iter_completed(get_status_fn, job_ids, options):
+        pass
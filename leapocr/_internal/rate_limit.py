@@ -0,0 +1,76 @@
+"""Client-side rate limiting for LeapOCR SDK."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket that paces requests below a target rate.
+
+    Tokens refill continuously at ``rate`` tokens per second, up to ``capacity``.
+    Each request consumes one token; when the bucket is empty, ``acquire()``
+    waits for the next token instead of letting the request be rejected by the
+    server with a 429.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            rate: Refill rate in tokens (requests) per second
+            capacity: Maximum burst size (default: max(rate, 1))
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        # Created lazily so the bucket can be built outside a running event loop
+        self._lock: asyncio.Lock | None = None
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last update."""
+        now = time.monotonic()
+        if now <= self._updated_at:
+            # Paused: nothing accrues until the pause ends
+            return
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                paused_for = max(self._updated_at - time.monotonic(), 0.0)
+                await asyncio.sleep(paused_for + (1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (e.g. from a Retry-After header).
+
+        Args:
+            seconds: How long to pause before tokens start refilling again
+        """
+        resume_at = time.monotonic() + seconds
+        if resume_at > self._updated_at:
+            self._tokens = 0.0
+            self._updated_at = resume_at
+
+    def drain(self) -> None:
+        """Discard any saved-up burst, e.g. when the server reports no quota left."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import random
 from collections.abc import Awaitable
 from typing import Callable, TypeVar
 
-from ..errors import LeapOCRError, NetworkError, RateLimitError
+from ..errors import APIError, LeapOCRError, NetworkError, RateLimitError
 
 T = TypeVar("T")
 
@@ -53,15 +54,21 @@ async def with_retry(
     retry_delay: float = 1.0,
     retry_multiplier: float = 2.0,
     is_retryable: Callable[[Exception], bool] | None = None,
+    jitter: float = 0.1,
 ) -> T:
     """Execute an async operation with exponential backoff retry.
 
+    A ``Retry-After`` delay sent by the server (on 429 or 503 responses) takes
+    precedence over the computed backoff.
+
     Args:
         operation: Async function to execute
         max_retries: Maximum number of retry attempts (default: 3)
         retry_delay: Initial delay between retries in seconds (default: 1.0)
         retry_multiplier: Multiplier for exponential backoff (default: 2.0)
         is_retryable: Optional function to determine if error is retryable
+        jitter: Random extra backoff, as a fraction of the delay, so clients
+            that failed together don't retry in lockstep (default: 0.1)
 
     Returns:
         Result from the operation
@@ -87,12 +94,13 @@ async def with_retry(
                 raise
 
             # Calculate delay with exponential backoff
-            if isinstance(error, RateLimitError) and error.retry_after:
+            if isinstance(error, (RateLimitError, APIError)) and error.retry_after:
                 # Use server-provided retry-after if available
                 delay = float(error.retry_after)
             else:
-                # Exponential backoff: delay * (multiplier ^ attempt)
+                # Exponential backoff: delay * (multiplier ^ attempt), plus jitter
                 delay = retry_delay * (retry_multiplier**attempt)
+                delay += random.uniform(0, delay * jitter)
 
             # Wait before retry
             await asyncio.sleep(delay)
@@ -0,0 +1,44 @@
+"""JSON (de)serialization for API payloads.
+
+Uses ``orjson`` when it is installed (``pip install leapocr[speedups]``), which
+parses large structured results several times faster than the standard library
+and encodes straight to bytes. Falls back to the stdlib ``json`` module.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)  # type: ignore[no-any-return]
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,12 +1,97 @@
 """File upload utilities for multipart S3 uploads."""
 
-from typing import Any, BinaryIO
+import os
+import stat
+from collections.abc import AsyncIterator
+from typing import Any, BinaryIO, Optional
 
 import httpx
 
 from ..errors import FileError, NetworkError
+from .utils import shared_ssl_context
 from .validation import get_file_size, guess_content_type
 
+# Default size of each read when streaming a part from the file (64KB)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _pread_fileno(file: BinaryIO) -> Optional[int]:
+    """Return the descriptor of a regular file that can be read with ``os.pread``.
+
+    Args:
+        file: File-like object
+
+    Returns:
+        File descriptor, or None for in-memory files, pipes and platforms
+        without ``os.pread`` (Windows)
+    """
+    if not hasattr(os, "pread"):
+        return None
+    try:
+        fd = file.fileno()
+        if stat.S_ISREG(os.fstat(fd).st_mode):
+            return fd
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+
+async def _read_range(
+    file: BinaryIO,
+    start: int,
+    length: int,
+    part_number: int,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Stream a byte range of a file in fixed-size chunks.
+
+    Keeps memory usage constant regardless of part size, instead of
+    materializing the whole part as a single bytes object. Regular files are
+    read with ``os.pread``: one syscall per chunk instead of a seek plus a
+    read, bypassing the file object's buffer (which would only add a copy).
+
+    Args:
+        file: File-like object (must support seek/read)
+        start: Offset of the first byte
+        length: Number of bytes to stream
+        part_number: Part number (for error messages)
+        chunk_size: Maximum bytes per read (default: STREAM_CHUNK_SIZE)
+
+    Yields:
+        Chunks of at most chunk_size bytes
+
+    Raises:
+        FileError: If the file cannot be read or ends before the range does
+    """
+    offset = start
+    remaining = length
+    fd = _pread_fileno(file)
+
+    while remaining > 0:
+        try:
+            if fd is not None:
+                data = os.pread(fd, min(chunk_size, remaining), offset)
+            else:
+                # Seek on every read so the range is independent of the shared position
+                file.seek(offset)
+                data = file.read(min(chunk_size, remaining))
+        except OSError as e:
+            raise FileError(
+                f"Failed to read file chunk for part {part_number}: {e}",
+                file_path=getattr(file, "name", None),
+            )
+
+        if not data:
+            raise FileError(
+                f"Failed to read expected chunk size for part {part_number}: "
+                f"got {length - remaining} bytes, expected {length} bytes",
+                file_path=getattr(file, "name", None),
+            )
+
+        offset += len(data)
+        remaining -= len(data)
+        yield data
+
 
 class MultipartUploader:
     """Handle multipart file uploads to S3 via presigned URLs.
@@ -15,14 +100,34 @@ class MultipartUploader:
     returned from the LeapOCR API.
     """
 
-    def __init__(self, timeout: float = 300.0):
+    def __init__(
+        self,
+        timeout: float = 300.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ):
         """Initialize the uploader.
 
         Args:
             timeout: Timeout for upload requests in seconds (default: 5 minutes)
+            limits: Connection pool limits (default: httpx defaults)
+            http2: Enable HTTP/2 for upload connections (default: False)
+            chunk_size: Bytes read from the file per chunk while streaming a part
+                (default: 64KB)
         """
-        # Separate HTTP client for S3 uploads (no auth needed, different domain)
-        self._s3_client = httpx.AsyncClient(timeout=timeout)
+        self.chunk_size = chunk_size
+        # Separate HTTP client for S3 uploads, sharing the API client's TLS
+        # context. It deliberately carries no API credentials: presigned URLs
+        # are authorized by their query signature, and an extra auth header
+        # would leak the API key to the storage host and can break the signature.
+        verify = shared_ssl_context(http2)
+        if limits is None:
+            self._s3_client = httpx.AsyncClient(timeout=timeout, http2=http2, verify=verify)
+        else:
+            self._s3_client = httpx.AsyncClient(
+                timeout=timeout, limits=limits, http2=http2, verify=verify
+            )
 
     async def close(self) -> None:
         """Close the S3 HTTP client."""
@@ -63,30 +168,13 @@ class MultipartUploader:
             # Calculate chunk size (end_byte is inclusive)
             chunk_size = end_byte - start_byte + 1
 
-            # Read chunk from file
-            try:
-                file.seek(start_byte)
-                chunk_data = file.read(chunk_size)
-            except OSError as e:
-                raise FileError(
-                    f"Failed to read file chunk for part {part_number}: {e}",
-                    file_path=getattr(file, "name", None),
-                )
-
-            if len(chunk_data) != chunk_size:
-                raise FileError(
-                    f"Failed to read expected chunk size for part {part_number}: "
-                    f"got {len(chunk_data)} bytes, expected {chunk_size} bytes",
-                    file_path=getattr(file, "name", None),
-                )
-
-            # Upload to S3 via presigned URL (raw PUT, not multipart/form-data)
+            # Stream to S3 via presigned URL (raw PUT, not multipart/form-data)
             try:
                 response = await self._s3_client.put(
                     upload_url,
-                    content=chunk_data,
+                    content=_read_range(file, start_byte, chunk_size, part_number, self.chunk_size),
                     headers={
-                        "Content-Length": str(len(chunk_data)),
+                        "Content-Length": str(chunk_size),
                     },
                 )
                 response.raise_for_status()
@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+import asyncio
+import functools
+import math
+import ssl
+import sys
+from collections.abc import Awaitable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
 
+import httpx
 
+from ..models import JobStatusType
+
+T = TypeVar("T")
+
+# Value -> member table for status fields in API responses. Calling
+# JobStatusType(value) goes through EnumMeta.__call__ and Enum.__new__ on every
+# parse; a plain dict lookup skips that machinery.
+_JOB_STATUS_BY_VALUE: dict[str, JobStatusType] = {m.value: m for m in JobStatusType}
+
+
+@functools.lru_cache(maxsize=256)
 def parse_datetime(s: str | None) -> datetime:
     """Parse RFC3339 datetime string.
 
+    Results are cached: every status poll of a job repeats the same
+    ``created_at`` (and often ``updated_at``) value, and datetimes are
+    immutable, so repeated strings are parsed once.
+
     Args:
         s: RFC3339 datetime string (e.g., "2023-12-25T10:30:00Z")
 
@@ -20,8 +43,8 @@ def parse_datetime(s: str | None) -> datetime:
         return datetime.fromtimestamp(0)
 
     # Handle 'Z' timezone suffix by converting to +00:00
-    # Python's fromisoformat doesn't support 'Z' directly
-    if s.endswith("Z"):
+    # fromisoformat only accepts 'Z' directly from Python 3.11
+    if sys.version_info < (3, 11) and s.endswith("Z"):
         s = s[:-1] + "+00:00"
 
     try:
@@ -53,3 +76,95 @@ def calculate_progress(status_data: dict[str, Any]) -> float:
     progress = (processed / total) * 100.0
     result: float = min(100.0, max(0.0, progress))
     return result
+
+
+def parse_job_status(value: str) -> JobStatusType:
+    """Convert a status string from the API to a JobStatusType.
+
+    Args:
+        value: Status value (e.g., "completed")
+
+    Returns:
+        Matching JobStatusType member
+
+    Raises:
+        ValueError: If the value is not a known status
+    """
+    status = _JOB_STATUS_BY_VALUE.get(value)
+    return status if status is not None else JobStatusType(value)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Delay in seconds (never negative), or None if missing, unparseable or
+        not finite
+    """
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # "inf", "nan" and overflowing values like "1e999" are not usable delays
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@functools.cache
+def shared_ssl_context(http2: bool = False) -> ssl.SSLContext:
+    """Return a process-wide TLS context for SDK HTTP clients.
+
+    Building a context loads the CA bundle, which costs tens of milliseconds
+    per HTTP client. The API client and the upload client share one instead.
+    Contexts are keyed by ``http2`` because the connection pool sets ALPN
+    protocols on the context it is given.
+
+    Args:
+        http2: Whether the clients using the context negotiate HTTP/2
+
+    Returns:
+        SSL context with the default verification settings
+    """
+    return httpx.create_ssl_context()
+
+
+async def gather_or_cancel(*aws: Awaitable[T]) -> list[T]:
+    """Run awaitables concurrently, cancelling the rest as soon as one fails.
+
+    Plain asyncio.gather() propagates the first error but leaves the other
+    tasks running unobserved, e.g. uploads whose batch already failed. Like
+    asyncio.TaskGroup (not available on Python 3.9), this cancels the siblings
+    and waits for them to finish before re-raising the original error.
+
+    Args:
+        *aws: Coroutines or futures to run
+
+    Returns:
+        Results in the same order as the awaitables
+
+    Raises:
+        Exception: The first error raised by any of the awaitables
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,186 @@
+"""Content-addressed job cache for LeapOCR SDK.
+
+Re-submitting an identical document with identical options re-runs the whole
+OCR pipeline. A ``ResultCache`` remembers which job processed a given
+``sha256(file_bytes) + options`` key, so ``process_file`` can return the
+existing job instead of uploading the file again. On a hit the job's current
+status is fetched; failed or deleted jobs are dropped from the cache and the
+file is uploaded again.
+
+Example:
+    >>> from leapocr import ClientConfig, DiskCache, LeapOCR
+    >>>
+    >>> config = ClientConfig(cache=DiskCache(".leapocr_cache"))
+    >>> async with LeapOCR("your-api-key", config) as client:
+    ...     job = await client.ocr.process_file("invoice.pdf")  # uploads
+    ...     job = await client.ocr.process_file("invoice.pdf")  # cache hit
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from ._internal.serialization import dumps, loads
+from ._internal.utils import parse_job_status
+from .models import Model, ProcessOptions, ProcessResult
+
+# Read size used when hashing file contents
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file: BinaryIO) -> str:
+    """Compute the SHA-256 digest of a file's contents.
+
+    The file position is restored afterwards so the file can still be uploaded.
+
+    Args:
+        file: Seekable binary file-like object
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    position = file.tell()
+    file.seek(0)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    file.seek(position)
+    return digest.hexdigest()
+
+
+def cache_key(digest: str, options: ProcessOptions) -> str:
+    """Build a cache key from a content digest and the options that affect output.
+
+    Args:
+        digest: Content digest of the document
+        options: Processing options
+
+    Returns:
+        Cache key string
+    """
+    model = options.model.value if isinstance(options.model, Model) else options.model
+    # Always stdlib json: keys must not change when orjson is installed
+    fingerprint = json.dumps(
+        {
+            "format": options.format.value,
+            "model": model,
+            "schema": options.schema,
+            "instructions": options.instructions,
+            "template_slug": options.template_slug,
+        },
+        sort_keys=True,
+    )
+    options_digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+    return f"{digest}:{options_digest}"
+
+
+def _serialize(result: ProcessResult) -> dict[str, Any]:
+    return {
+        "job_id": result.job_id,
+        "status": result.status.value,
+        "created_at": result.created_at.isoformat(),
+    }
+
+
+def _deserialize(data: dict[str, Any]) -> ProcessResult:
+    return ProcessResult(
+        job_id=data["job_id"],
+        status=parse_job_status(data["status"]),
+        created_at=datetime.fromisoformat(data["created_at"]),
+    )
+
+
+class ResultCache(ABC):
+    """Base class for job caches keyed by document content and options."""
+
+    @abstractmethod
+    def get(self, key: str) -> ProcessResult | None:
+        """Return the cached job for a key, or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, result: ProcessResult) -> None:
+        """Store the job created for a key."""
+
+    @abstractmethod
+    def discard_job(self, job_id: str) -> None:
+        """Remove every entry pointing at a job (e.g. after it is deleted)."""
+
+
+class MemoryCache(ResultCache):
+    """In-process cache backed by a dict."""
+
+    def __init__(self, ttl: float | None = None) -> None:
+        """Initialize the memory cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored (default: no expiry)
+        """
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, ProcessResult]] = {}
+
+    def get(self, key: str) -> ProcessResult | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        return result
+
+    def set(self, key: str, result: ProcessResult) -> None:
+        self._entries[key] = (time.monotonic(), result)
+
+    def discard_job(self, job_id: str) -> None:
+        self._entries = {k: v for k, v in self._entries.items() if v[1].job_id != job_id}
+
+
+class DiskCache(ResultCache):
+    """Persistent cache storing one JSON file per entry in a directory."""
+
+    def __init__(self, directory: str | Path, ttl: float | None = None) -> None:
+        """Initialize the disk cache.
+
+        Args:
+            directory: Directory for cache files (created if missing)
+            ttl: Seconds an entry stays valid after it is stored, measured from the
+                file's modification time (default: no expiry)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> ProcessResult | None:
+        path = self._path(key)
+        try:
+            if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return _deserialize(loads(path.read_bytes()))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, result: ProcessResult) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(dumps(_serialize(result)))
+        os.replace(tmp_path, path)
+
+    def discard_job(self, job_id: str) -> None:
+        for path in self.directory.glob("*.json"):
+            try:
+                data = loads(path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            if data.get("job_id") == job_id:
+                path.unlink(missing_ok=True)
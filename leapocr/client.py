@@ -2,15 +2,44 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from typing import Any
 
 import httpx
 
 from . import __version__
+from ._internal.utils import shared_ssl_context
 from .config import ClientConfig
-from .errors import AuthenticationError
+from .errors import AuthenticationError, ValidationError
 from .ocr import OCRService
 
+# Computed once per process rather than per client
+_USER_AGENT = f"leapocr-python/{__version__}"
+
+
+def _parse_base_url(base_url: str) -> httpx.URL:
+    """Parse and validate the API base URL.
+
+    Args:
+        base_url: Configured base URL
+
+    Returns:
+        Parsed URL
+
+    Raises:
+        ValidationError: If the URL is malformed or not an absolute http(s) URL
+    """
+    try:
+        url = httpx.URL(base_url)
+    except httpx.InvalidURL as e:
+        raise ValidationError(f"Invalid base_url: {e}", field="base_url") from e
+    if url.scheme not in ("http", "https") or not url.host:
+        raise ValidationError(
+            f"base_url must be an absolute http(s) URL, got {base_url!r}", field="base_url"
+        )
+    return url
+
 
 class LeapOCR:
     """Main client for LeapOCR API.
@@ -33,18 +62,50 @@ class LeapOCR:
 
         Raises:
             AuthenticationError: If API key is missing or empty
+            ValidationError: If the configured base_url is not an http(s) URL
         """
-        if not api_key or not api_key.strip():
+        # Checked once per client; isspace() avoids building a stripped copy
+        if not api_key or api_key.isspace():
             raise AuthenticationError("API key is required")
 
         self.api_key = api_key
         self.config = config or ClientConfig()
 
-        # Setup HTTP client for API requests
+        # Parsed and checked once, so a typo fails here rather than on the first
+        # request, and every HTTP client reuses the parsed URL
+        self._base_url = _parse_base_url(self.config.base_url)
+
+        # Built once and shared by every HTTP client (and, for a borrowed client,
+        # every request) of this instance
+        self._auth_headers = {"X-API-KEY": self.api_key, "User-Agent": _USER_AGENT}
+
+        # Setup HTTP client for API requests. A client passed in via the config
+        # is borrowed, not owned: it may be shared by other LeapOCR instances
+        # (possibly with other API keys), so credentials are sent per request
+        # and close() leaves it open.
+        self._owns_http_client = self.config.http_client is None
         self._http_client = self._create_http_client()
 
+        # A single HTTP/2 connection multiplexes every request and becomes the
+        # bottleneck under high concurrency; extra clients each open their own
+        # connection and requests are spread across them
+        self._extra_http_clients: list[httpx.AsyncClient] = []
+        if self._owns_http_client and self.config.http2:
+            self._extra_http_clients = [
+                self._create_http_client() for _ in range(self.config.http2_connections - 1)
+            ]
+
         # Initialize services
-        self.ocr = OCRService(self._http_client, self.config)
+        request_headers = None if self._owns_http_client else self._auth_headers
+        self.ocr = OCRService(
+            self._http_client,
+            self.config,
+            headers=request_headers,
+            extra_http_clients=self._extra_http_clients,
+        )
+
+        # Background connection warm-up started on context manager entry
+        self._prewarm_task: asyncio.Task[bool] | None = None
 
     def _create_http_client(self) -> httpx.AsyncClient:
         """Create configured HTTP client for API requests.
@@ -55,16 +116,14 @@ class LeapOCR:
         if self.config.http_client:
             return self.config.http_client
 
-        headers = {
-            "X-API-KEY": self.api_key,
-            "User-Agent": f"leapocr-python/{__version__}",
-            "Content-Type": "application/json",
-        }
-
+        # No default Content-Type: OCRService sets it on requests with a JSON body
         return httpx.AsyncClient(
-            base_url=self.config.base_url,
+            base_url=self._base_url,
             timeout=self.config.timeout,
-            headers=headers,
+            headers=self._auth_headers,
+            limits=self.config.limits,
+            http2=self.config.http2,
+            verify=shared_ssl_context(self.config.http2),
         )
 
     async def close(self) -> None:
@@ -73,12 +132,23 @@ class LeapOCR:
         Should be called when done using the client, or use the client
         as an async context manager.
         """
-        await self._http_client.aclose()
-        if hasattr(self.ocr, "_uploader"):
-            await self.ocr._uploader.close()
+        if self._prewarm_task is not None and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+            # Let the health checks unwind before their clients are closed
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._prewarm_task
+        if self._owns_http_client:
+            await self._http_client.aclose()
+        for http_client in self._extra_http_clients:
+            await http_client.aclose()
+        await self.ocr._close_uploader()
 
     async def __aenter__(self) -> LeapOCR:
         """Async context manager entry."""
+        if self.config.prewarm:
+            # Establish pooled connections (DNS + TLS) while the caller prepares
+            # its first request; health checks never raise
+            self._prewarm_task = asyncio.create_task(self._prewarm())
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -88,11 +158,32 @@ class LeapOCR:
     async def health(self) -> bool:
         """Check API health status.
 
+        Returns:
+            True if API is healthy, False otherwise
+        """
+        return await self._check_health(self._http_client)
+
+    async def _prewarm(self) -> bool:
+        """Open a connection on the primary client and every extra HTTP/2 client.
+
+        Returns:
+            True if every health check succeeded, False otherwise
+        """
+        clients = [self._http_client, *self._extra_http_clients]
+        return all(await asyncio.gather(*(self._check_health(c) for c in clients)))
+
+    @staticmethod
+    async def _check_health(http_client: httpx.AsyncClient) -> bool:
+        """Send a health check through one HTTP client.
+
+        Args:
+            http_client: Client whose connection pool is used
+
         Returns:
             True if API is healthy, False otherwise
         """
         try:
-            response = await self._http_client.get("/health")
+            response = await http_client.get("/health")
             return response.status_code == 200
         except Exception:
             return False
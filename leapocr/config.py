@@ -6,6 +6,8 @@ from typing import Optional
 
 import httpx
 
+from .cache import ResultCache
+
 
 @dataclass
 class ClientConfig:
@@ -17,7 +19,22 @@ class ClientConfig:
         max_retries: Maximum number of retries for transient errors (default: 3)
         retry_delay: Initial retry delay in seconds (default: 1.0)
         retry_multiplier: Exponential backoff multiplier (default: 2.0)
-        http_client: Custom httpx AsyncClient (optional)
+        rate_limit: Maximum API requests per second, paced client-side (default: None)
+        max_connections: Maximum concurrent connections in the pool (default: 100)
+        max_keepalive_connections: Maximum idle connections kept alive (default: 100)
+        keepalive_expiry: Seconds an idle connection is kept alive (default: 30.0)
+        http2: Enable HTTP/2 multiplexing, requires ``leapocr[http2]`` (default: False)
+        http2_connections: Number of HTTP/2 connections API requests are spread
+            across round-robin when ``http2`` is enabled (default: 1)
+        prewarm: Open connections in the background on ``async with`` entry so the
+            first request skips DNS and TLS setup (default: False)
+        cache: Cache reusing jobs for identical file uploads (default: None)
+        upload_chunk_size: Bytes read per chunk when streaming file uploads; larger
+            chunks mean fewer reads for big files (default: 65536)
+        result_cache_size: Completed job results kept in memory, so fetching the
+            same job and page again skips the request; 0 disables (default: 128)
+        http_client: Custom httpx AsyncClient (optional). It is never closed by
+            the SDK, so one client can be shared by several LeapOCR instances
         debug: Enable debug logging (default: False)
     """
 
@@ -26,9 +43,30 @@ class ClientConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     retry_multiplier: float = 2.0
+    rate_limit: Optional[float] = None
+    max_connections: int = 100
+    # Keep every pooled connection warm across polling intervals so repeated
+    # calls skip the TCP and TLS handshakes
+    max_keepalive_connections: int = 100
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    http2_connections: int = 1
+    prewarm: bool = False
+    cache: Optional[ResultCache] = None
+    upload_chunk_size: int = 64 * 1024
+    result_cache_size: int = 128
     http_client: Optional[httpx.AsyncClient] = None
     debug: bool = False
 
+    @property
+    def limits(self) -> httpx.Limits:
+        """Connection pool limits built from the pool settings."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
     @classmethod
     def from_env(cls) -> "ClientConfig":
         """Create configuration from environment variables.
@@ -4,7 +4,14 @@ from typing import Any, Optional
 
 
 class LeapOCRError(Exception):
-    """Base exception for all LeapOCR SDK errors."""
+    """Base exception for all LeapOCR SDK errors.
+
+    Every class in the hierarchy declares ``__slots__`` so raising an error
+    does not allocate a per-instance attribute dict; this matters in
+    retry-heavy workloads where many errors are created and discarded.
+    """
+
+    __slots__ = ("message", "code", "status_code", "details")
 
     def __init__(
         self,
@@ -22,10 +29,35 @@ class LeapOCRError(Exception):
         if cause is not None:
             self.__cause__ = cause
 
+    def __reduce__(self) -> Any:
+        # BaseException only pickles __dict__, so slot values are added explicitly
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return (_restore_error, (type(self), self.args, state))
+
+
+def _restore_error(cls: type[LeapOCRError], args: tuple[Any, ...], state: dict[str, Any]) -> Any:
+    """Rebuild a pickled error without calling ``__init__``.
+
+    Subclass constructors take required arguments (``job_id``, ``status_code``)
+    that are not part of ``args``, so the instance is created with ``__new__``
+    and its attributes restored directly.
+    """
+    err = cls.__new__(cls, *args)
+    err.args = args
+    for name, value in state.items():
+        setattr(err, name, value)
+    return err
+
 
 class AuthenticationError(LeapOCRError):
     """Authentication failed - invalid or missing API key."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Authentication failed - invalid or missing API key",
@@ -37,6 +69,8 @@ class AuthenticationError(LeapOCRError):
 class RateLimitError(LeapOCRError):
     """Rate limit exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str,
@@ -50,6 +84,8 @@ class RateLimitError(LeapOCRError):
 class ValidationError(LeapOCRError):
     """Validation error - invalid input parameters."""
 
+    __slots__ = ("field",)
+
     def __init__(
         self,
         message: str,
@@ -63,6 +99,8 @@ class ValidationError(LeapOCRError):
 class FileError(LeapOCRError):
     """File-related error (not found, too large, invalid type, etc)."""
 
+    __slots__ = ("file_path", "file_size")
+
     def __init__(
         self,
         message: str,
@@ -78,6 +116,8 @@ class FileError(LeapOCRError):
 class JobError(LeapOCRError):
     """Base class for job-related errors."""
 
+    __slots__ = ("job_id",)
+
     def __init__(
         self,
         message: str,
@@ -92,6 +132,8 @@ class JobError(LeapOCRError):
 class JobFailedError(JobError):
     """Job processing failed."""
 
+    __slots__ = ("error_details",)
+
     def __init__(
         self,
         message: str,
@@ -106,6 +148,8 @@ class JobFailedError(JobError):
 class JobTimeoutError(JobError):
     """Job processing timeout."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -118,6 +162,8 @@ class JobTimeoutError(JobError):
 class NetworkError(LeapOCRError):
     """Network connectivity error."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -129,20 +175,26 @@ class NetworkError(LeapOCRError):
 class APIError(LeapOCRError):
     """API returned an error response."""
 
+    __slots__ = ("response", "retry_after")
+
     def __init__(
         self,
         message: str,
         status_code: int,
         response: Optional[Any] = None,
+        retry_after: Optional[float] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(message, code="api_error", status_code=status_code, **kwargs)
         self.response = response
+        self.retry_after = retry_after
 
 
 class InsufficientCreditsError(LeapOCRError):
     """Insufficient credits to process the request."""
 
+    __slots__ = ("credits_available", "credits_required")
+
     def __init__(
         self,
         message: str = "Insufficient credits to process this request",
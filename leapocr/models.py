@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Awaitable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, Callable, Union
+
+# Response models are created in bulk (one PageResult per page), so they use
+# __slots__ where dataclasses support it (Python 3.10+) to skip the per-instance
+# __dict__.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class Format(str, Enum):
@@ -60,13 +67,29 @@ class ProcessOptions:
     metadata: dict[str, str] = field(default_factory=dict)
 
 
+# Progress callbacks may be plain functions or coroutine functions
+ProgressCallback = Callable[["JobStatus"], Union[None, Awaitable[None]]]
+
+
 @dataclass
 class PollOptions:
-    """Options for polling job status."""
+    """Options for polling job status.
+
+    Args:
+        poll_interval: Initial delay between status checks in seconds
+        max_wait: Maximum total wait time in seconds
+        on_progress: Callback invoked with each JobStatus; may be async
+        backoff_multiplier: Factor the delay grows by after each check (1.0 disables backoff)
+        max_interval: Upper bound for the delay between checks in seconds
+        jitter: Random extra delay as a fraction of the interval (0.0 disables jitter)
+    """
 
     poll_interval: float = 2.0  # seconds
     max_wait: float = 300.0  # seconds (5 minutes)
-    on_progress: Callable[[JobStatus], None] | None = None
+    on_progress: ProgressCallback | None = None
+    backoff_multiplier: float = 1.5
+    max_interval: float = 10.0  # seconds
+    jitter: float = 0.1
 
 
 @dataclass
@@ -81,7 +104,7 @@ class ClientConfig:
     debug: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProcessResult:
     """Result from initiating OCR processing."""
 
@@ -91,7 +114,7 @@ class ProcessResult:
     estimated_completion: datetime | None = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class JobStatus:
     """Job status information."""
 
@@ -103,9 +126,10 @@ class JobStatus:
     created_at: datetime
     updated_at: datetime
     error_message: str | None = None
+    retry_after: float | None = None  # server-suggested seconds until next poll
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class PageResult:
     """Result for a single page."""
 
@@ -114,7 +138,7 @@ class PageResult:
     id: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class PaginationInfo:
     """Pagination information for results."""
 
@@ -124,7 +148,7 @@ class PaginationInfo:
     total_pages: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class JobResult:
     """Complete job results."""
 
@@ -141,7 +165,7 @@ class JobResult:
     pagination: PaginationInfo | None = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ModelInfo:
     """OCR model information."""
 
@@ -152,7 +176,7 @@ class ModelInfo:
     priority: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BatchResult:
     """Result from batch processing."""
 
@@ -2,18 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
+import itertools
+import math
+import operator
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Sequence
 from pathlib import Path
-from typing import Any, BinaryIO
+from typing import Any, BinaryIO, Callable, Literal, overload
 
 import httpx
+from typing_extensions import TypeGuard
 
-from ._internal.polling import poll_until_done
+from ._internal.polling import (
+    DEFAULT_POLL_OPTIONS,
+    iter_completed,
+    poll_many_until_done,
+    poll_until_done,
+)
+from ._internal.rate_limit import TokenBucket
 from ._internal.retry import with_retry
+from ._internal.serialization import dumps, loads
 from ._internal.upload import MultipartUploader
-from ._internal.utils import calculate_progress, parse_datetime
+from ._internal.utils import (
+    calculate_progress,
+    gather_or_cancel,
+    parse_datetime,
+    parse_job_status,
+    parse_retry_after,
+)
 from ._internal.validation import get_file_size, guess_content_type, validate_file
+from .cache import ResultCache, cache_key, file_digest
 from .config import ClientConfig
-from .errors import APIError, FileError, JobError
+from .errors import (
+    APIError,
+    AuthenticationError,
+    FileError,
+    InsufficientCreditsError,
+    JobError,
+    LeapOCRError,
+    RateLimitError,
+    ValidationError,
+)
 from .models import (
     JobResult,
     JobStatus,
@@ -27,6 +59,84 @@ from .models import (
 )
 
 
+def _rate_limit_error(message: str, response: httpx.Response) -> LeapOCRError:
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    return RateLimitError(
+        message,
+        retry_after=math.ceil(retry_after) if retry_after is not None else None,
+        details=response.text,
+    )
+
+
+# Used when a call passes no options; only ever read, never mutated
+_DEFAULT_PROCESS_OPTIONS = ProcessOptions()
+
+# Statuses raised inside the retry loop so with_retry backs off and retries them
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Error responses with a dedicated exception type, keyed by status code. Any
+# other non-2xx status raises APIError.
+_ERROR_FACTORIES: dict[int, Callable[[str, httpx.Response], LeapOCRError]] = {
+    400: lambda message, response: ValidationError(message, details=response.text),
+    401: lambda message, response: AuthenticationError(message, details=response.text),
+    402: lambda message, response: InsufficientCreditsError(message, details=response.text),
+    429: _rate_limit_error,
+}
+
+
+# Pagination fields in PaginationInfo order, extracted in one C-level call
+_PAGINATION_FIELDS = operator.itemgetter("page", "limit", "total", "total_pages")
+
+
+_URL_PREFIXES = ("http://", "https://")
+
+
+def _is_url(source: str | Path | BinaryIO) -> TypeGuard[str]:
+    """Whether a batch source is a document URL rather than a file.
+
+    Only ``str`` sources can be URLs: ``Path`` collapses the double slash
+    (``Path("https://x")`` is ``https:/x``), so paths are always files.
+    """
+    return isinstance(source, str) and source.startswith(_URL_PREFIXES)
+
+
+def _copy_result(result: JobResult) -> JobResult:
+    """Copy a cached result so callers editing it (or its page list) don't alter the cache."""
+    return dataclasses.replace(result, pages=list(result.pages))
+
+
+# Consecutive 202s from the results endpoint before wait_until_done re-checks
+# the status endpoint, so a job that fails while finalizing is still reported
+_FINALIZE_STATUS_RECHECK = 5
+
+
+def _all_pages_processed(status: JobStatus) -> bool:
+    """Whether a still-running job has processed every page and is about to finish."""
+    return status.total_pages > 0 and status.processed_pages >= status.total_pages
+
+
+def _options_payload(options: ProcessOptions) -> dict[str, Any]:
+    """Build the request fields shared by URL and file submissions.
+
+    Args:
+        options: Processing options
+
+    Returns:
+        Dictionary with format and any optional fields that are set
+    """
+    payload: dict[str, Any] = {"format": options.format.value}
+    if options.model:
+        model = options.model
+        payload["model"] = model.value if isinstance(model, Model) else model
+    if options.schema:
+        payload["schema"] = options.schema
+    if options.instructions:
+        payload["instructions"] = options.instructions
+    if options.template_slug:
+        payload["template_slug"] = options.template_slug
+    return payload
+
+
 class OCRService:
     """OCR operations service.
 
@@ -34,24 +144,64 @@ class OCRService:
     and retrieving results.
     """
 
-    def __init__(self, http_client: httpx.AsyncClient, config: ClientConfig) -> None:
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        config: ClientConfig,
+        headers: dict[str, str] | None = None,
+        extra_http_clients: list[httpx.AsyncClient] | None = None,
+    ) -> None:
         """Initialize OCR service.
 
         Args:
             http_client: HTTP client for API requests
             config: Client configuration
+            headers: Headers sent with every API request, for shared HTTP clients
+                that do not carry this service's credentials
+            extra_http_clients: Additional clients (separate connections) that API
+                requests are distributed across round-robin
         """
         self._client = http_client
+        self._next_client = itertools.cycle([http_client, *(extra_http_clients or [])]).__next__
         self._config = config
-        self._uploader = MultipartUploader(timeout=300.0)
+        # Built once here rather than copied and extended on every request
+        self._headers = headers
+        self._json_headers = {**(headers or {}), "Content-Type": "application/json"}
+        self._rate_limiter = TokenBucket(config.rate_limit) if config.rate_limit else None
+        # Results of completed jobs never change, so recent ones are kept (LRU)
+        # keyed by (job_id, page, limit)
+        self._results: OrderedDict[tuple[str, int, int], JobResult] = OrderedDict()
+
+    @functools.cached_property
+    def _uploader(self) -> MultipartUploader:
+        """Upload client, created on first file upload.
+
+        Callers that only submit URLs or poll jobs never pay for a second
+        connection pool.
+        """
+        return MultipartUploader(
+            timeout=300.0,
+            limits=self._config.limits,
+            http2=self._config.http2,
+            chunk_size=self._config.upload_chunk_size,
+        )
+
+    async def _close_uploader(self) -> None:
+        """Close the upload client if it was ever created."""
+        if "_uploader" in self.__dict__:
+            await self._uploader.close()
 
     async def process_file(
         self, file: str | Path | BinaryIO, options: ProcessOptions | None = None
     ) -> ProcessResult:
         """Process a file for OCR.
 
+        The file is streamed to storage in ``upload_chunk_size`` reads and is
+        never loaded into memory whole, so pass a path or an open file rather
+        than ``f.read()`` bytes. File-like objects must be seekable.
+
         Args:
-            file: File path (str/Path) or file-like object (BinaryIO)
+            file: File path (str/Path) or seekable file-like object (BinaryIO)
             options: Processing options (format, model, schema, etc.)
 
         Returns:
@@ -59,13 +209,18 @@ class OCRService:
 
         Raises:
             FileError: If file validation fails
-            APIError: If API request fails
+            ValidationError: If the API rejects the request (400)
+            AuthenticationError: If the API key is invalid (401)
+            InsufficientCreditsError: If the account is out of credits (402)
+            RateLimitError: If still rate limited after retries (429)
+            APIError: On any other error response
         """
-        options = options or ProcessOptions()
+        options = options or _DEFAULT_PROCESS_OPTIONS
 
         # Handle different input types
         if isinstance(file, (str, Path)):
-            file_path = Path(file)
+            # Path inputs (the common case for files) are used as-is, not re-wrapped
+            file_path = file if isinstance(file, Path) else Path(file)
 
             # Validate file
             validation = validate_file(file_path)
@@ -98,45 +253,141 @@ class OCRService:
             ProcessResult with job_id and initial status
 
         Raises:
-            APIError: If API request fails
+            ValidationError: If the API rejects the request (400)
+            AuthenticationError: If the API key is invalid (401)
+            InsufficientCreditsError: If the account is out of credits (402)
+            RateLimitError: If still rate limited after retries (429)
+            APIError: On any other error response
         """
-        options = options or ProcessOptions()
+        return await self._submit_url(url, _options_payload(options or _DEFAULT_PROCESS_OPTIONS))
 
-        payload: dict[str, Any] = {
-            "url": url,
-            "format": options.format.value,
-        }
+    async def _submit_url(self, url: str, fields: dict[str, Any]) -> ProcessResult:
+        """Submit a URL job with an already-built options payload.
 
-        if options.model:
-            payload["model"] = (
-                options.model.value if isinstance(options.model, Model) else options.model
-            )
-        if options.schema:
-            payload["schema"] = options.schema
-        if options.instructions:
-            payload["instructions"] = options.instructions
-        if options.template_slug:
-            payload["template_slug"] = options.template_slug
-
-        async def _make_request() -> httpx.Response:
-            return await self._client.post("/ocr/uploads/url", json=payload)
+        Args:
+            url: URL to the document
+            fields: Request fields from _options_payload()
 
-        response = await with_retry(
-            _make_request,
-            max_retries=self._config.max_retries,
-            retry_delay=self._config.retry_delay,
-            retry_multiplier=self._config.retry_multiplier,
-        )
+        Returns:
+            ProcessResult with job_id and initial status
+        """
+        payload = {"url": url, **fields}
+        response = await self._request("POST", "/ocr/uploads/url", payload=payload)
 
         self._check_response(response)
-        data = response.json()
+        data = loads(response.content)
 
         return ProcessResult(
             job_id=data["job_id"],
-            status=JobStatusType(data["status"]),
+            status=parse_job_status(data["status"]),
             created_at=parse_datetime(data["created_at"]),
         )
 
+    @overload
+    async def process_batch(
+        self,
+        sources: Sequence[str | Path | BinaryIO],
+        options: ProcessOptions | None = ...,
+        *,
+        max_concurrent: int = ...,
+        return_exceptions: Literal[False] = ...,
+        dedupe_urls: bool = ...,
+    ) -> list[ProcessResult]: ...
+
+    @overload
+    async def process_batch(
+        self,
+        sources: Sequence[str | Path | BinaryIO],
+        options: ProcessOptions | None = ...,
+        *,
+        max_concurrent: int = ...,
+        return_exceptions: Literal[True],
+        dedupe_urls: bool = ...,
+    ) -> list[ProcessResult | Exception]: ...
+
+    async def process_batch(
+        self,
+        sources: Sequence[str | Path | BinaryIO],
+        options: ProcessOptions | None = None,
+        *,
+        max_concurrent: int = 8,
+        return_exceptions: bool = False,
+        dedupe_urls: bool = False,
+    ) -> list[ProcessResult] | list[ProcessResult | Exception]:
+        """Submit several documents for OCR concurrently.
+
+        Sources that are ``http://`` or ``https://`` strings are submitted with
+        process_url(); anything else is treated as a file and uploaded with
+        process_file(). Submissions overlap on the event loop, at most
+        ``max_concurrent`` at a time.
+
+        Submitting is quick compared to processing, so the semaphore covers
+        only the submissions. Wait for the jobs afterwards with
+        wait_until_all_done() or iter_results(), which bound their polling
+        separately, rather than holding a submission slot while a job runs.
+
+        Args:
+            sources: URLs, file paths or file-like objects
+            options: Processing options applied to every document
+            max_concurrent: Maximum submissions in flight at once (default: 8)
+            return_exceptions: Return each failed submission's exception at the
+                source's position instead of raising the first one and cancelling
+                the submissions still in flight (default: False)
+            dedupe_urls: Submit each distinct URL once; repeated URLs share the
+                first occurrence's job (and result) instead of creating, and
+                being billed for, a second identical job (default: False)
+
+        Returns:
+            ProcessResults in the same order as sources, with exceptions in place
+            of failed submissions when return_exceptions is True
+
+        Raises:
+            FileError: If a file fails validation
+            ValidationError: If the API rejects the request (400)
+            AuthenticationError: If the API key is invalid (401)
+            InsufficientCreditsError: If the account is out of credits (402)
+            RateLimitError: If still rate limited after retries (429)
+            APIError: On any other error response
+            ValueError: If max_concurrent is less than 1
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrent)
+        # Every URL in the batch shares the same options, so build their fields once
+        url_fields = _options_payload(options or _DEFAULT_PROCESS_OPTIONS)
+
+        async def submit(source: str | Path | BinaryIO) -> ProcessResult:
+            async with semaphore:
+                if _is_url(source):
+                    return await self._submit_url(source, url_fields)
+                return await self.process_file(source, options)
+
+        # Index of the source whose result each position reuses (itself unless
+        # it repeats an earlier URL)
+        origin = list(range(len(sources)))
+        if dedupe_urls:
+            first_seen: dict[str, int] = {}
+            origin = [
+                first_seen.setdefault(source, i) if _is_url(source) else i
+                for i, source in enumerate(sources)
+            ]
+        unique = [i for i, o in enumerate(origin) if o == i]
+
+        if not return_exceptions:
+            results = await gather_or_cancel(*(submit(sources[i]) for i in unique))
+            by_index = dict(zip(unique, results))
+            return [by_index[o] for o in origin]
+
+        async def submit_or_error(source: str | Path | BinaryIO) -> ProcessResult | Exception:
+            try:
+                return await submit(source)
+            except Exception as e:
+                return e
+
+        outcomes = await asyncio.gather(*(submit_or_error(sources[i]) for i in unique))
+        by_index_or_error = dict(zip(unique, outcomes))
+        return [by_index_or_error[o] for o in origin]
+
     async def get_job_status(self, job_id: str) -> JobStatus:
         """Get job processing status.
 
@@ -147,31 +398,27 @@ class OCRService:
             JobStatus with current job state
 
         Raises:
-            APIError: If API request fails
+            ValidationError: If the API rejects the request (400)
+            AuthenticationError: If the API key is invalid (401)
+            InsufficientCreditsError: If the account is out of credits (402)
+            RateLimitError: If still rate limited after retries (429)
+            APIError: On any other error response
         """
-
-        async def _make_request() -> httpx.Response:
-            return await self._client.get(f"/ocr/status/{job_id}")
-
-        response = await with_retry(
-            _make_request,
-            max_retries=self._config.max_retries,
-            retry_delay=self._config.retry_delay,
-            retry_multiplier=self._config.retry_multiplier,
-        )
+        response = await self._request("GET", f"/ocr/status/{job_id}")
 
         self._check_response(response)
-        data = response.json()
+        data = loads(response.content)
 
         return JobStatus(
             job_id=data.get("job_id", data["id"]),  # API returns "id" not "job_id"
-            status=JobStatusType(data["status"]),
+            status=parse_job_status(data["status"]),
             processed_pages=data.get("processed_pages", 0),
             total_pages=data.get("total_pages", 0),
             progress=calculate_progress(data),
             created_at=parse_datetime(data["created_at"]),
             updated_at=parse_datetime(data.get("updated_at", data["created_at"])),
             error_message=data.get("error_message"),
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
         )
 
     async def delete_job(self, job_id: str) -> dict[str, Any]:
@@ -184,21 +431,20 @@ class OCRService:
             Dictionary with deletion confirmation
 
         Raises:
-            APIError: If API request fails
+            ValidationError: If the API rejects the request (400)
+            AuthenticationError: If the API key is invalid (401)
+            InsufficientCreditsError: If the account is out of credits (402)
+            RateLimitError: If still rate limited after retries (429)
+            APIError: On any other error response
         """
-
-        async def _make_request() -> httpx.Response:
-            return await self._client.delete(f"/ocr/delete/{job_id}")
-
-        response = await with_retry(
-            _make_request,
-            max_retries=self._config.max_retries,
-            retry_delay=self._config.retry_delay,
-            retry_multiplier=self._config.retry_multiplier,
-        )
+        response = await self._request("DELETE", f"/ocr/delete/{job_id}")
 
         self._check_response(response)
-        return response.json()  # type: ignore[no-any-return]
+        for key in [key for key in self._results if key[0] == job_id]:
+            del self._results[key]
+        if self._config.cache is not None:
+            self._config.cache.discard_job(job_id)
+        return loads(response.content)  # type: ignore[no-any-return]
 
     async def get_results(self, job_id: str, page: int = 1, limit: int = 100) -> JobResult:
         """Get job results.
@@ -213,19 +459,20 @@ class OCRService:
 
         Raises:
             JobError: If job is still processing
-            APIError: If API request fails
+            ValidationError: If the API rejects the request (400)
+            AuthenticationError: If the API key is invalid (401)
+            InsufficientCreditsError: If the account is out of credits (402)
+            RateLimitError: If still rate limited after retries (429)
+            APIError: On any other error response
         """
-
-        async def _make_request() -> httpx.Response:
-            return await self._client.get(
-                f"/ocr/result/{job_id}", params={"page": page, "limit": limit}
-            )
-
-        response = await with_retry(
-            _make_request,
-            max_retries=self._config.max_retries,
-            retry_delay=self._config.retry_delay,
-            retry_multiplier=self._config.retry_multiplier,
+        key = (job_id, page, limit)
+        cached = self._results.get(key)
+        if cached is not None:
+            self._results.move_to_end(key)
+            return _copy_result(cached)
+
+        response = await self._request(
+            "GET", f"/ocr/result/{job_id}", params={"page": page, "limit": limit}
         )
 
         # 202 means still processing
@@ -233,29 +480,22 @@ class OCRService:
             raise JobError("Job is still processing", job_id=job_id)
 
         self._check_response(response)
-        data = response.json()
+        data = loads(response.content)
 
         # Parse page results
         pages = [
-            PageResult(
-                page_number=p["page_number"],
-                result=p["result"],
-                id=p.get("id"),
-            )
-            for p in data.get("pages", [])
+            PageResult(page_number=p["page_number"], result=p["result"], id=p.get("id"))
+            for p in data.get("pages") or ()
         ]
 
         # Parse pagination
         pagination = None
         if "pagination" in data:
-            p = data["pagination"]
-            pagination = PaginationInfo(
-                page=p["page"], limit=p["limit"], total=p["total"], total_pages=p["total_pages"]
-            )
+            pagination = PaginationInfo(*_PAGINATION_FIELDS(data["pagination"]))
 
-        return JobResult(
+        result = JobResult(
             job_id=data["job_id"],
-            status=JobStatusType(data["status"]),
+            status=parse_job_status(data["status"]),
             pages=pages,
             file_name=data["file_name"],
             total_pages=data["total_pages"],
@@ -267,6 +507,13 @@ class OCRService:
             pagination=pagination,
         )
 
+        if result.status == JobStatusType.COMPLETED and self._config.result_cache_size > 0:
+            self._results[key] = result
+            if len(self._results) > self._config.result_cache_size:
+                self._results.popitem(last=False)
+            return _copy_result(result)
+        return result
+
     async def wait_until_done(
         self,
         job_id: str,
@@ -278,6 +525,14 @@ class OCRService:
         Use this after calling process_file() or process_url() for explicit
         control over job submission vs. waiting.
 
+        Once every page has been processed, the results endpoint is polled
+        instead of the status endpoint (it answers 202 until the job is done),
+        so a finishing job costs one request per tick rather than a final
+        status check followed by a results fetch. The status endpoint is
+        consulted again whenever the results endpoint answers with anything
+        but a completed result, and every few 202s, so a job that fails
+        while finalizing still raises JobFailedError with its error message.
+
         Args:
             job_id: Job ID to wait for
             poll_options: Polling configuration (interval, max_wait, callbacks)
@@ -289,14 +544,140 @@ class OCRService:
             JobTimeoutError: If processing doesn't complete in time
             JobFailedError: If processing fails
         """
-        poll_opts = poll_options or PollOptions()
+        poll_opts = poll_options or DEFAULT_POLL_OPTIONS
+        last_status: JobStatus | None = None
+        result: JobResult | None = None
+        finalizing_ticks = 0
 
         async def get_status(job_id: str) -> JobStatus:
-            """Wrapper to properly type the bound method."""
-            return await self.get_job_status(job_id)
+            nonlocal last_status, result, finalizing_ticks
+            if (
+                last_status is not None
+                and _all_pages_processed(last_status)
+                and finalizing_ticks < _FINALIZE_STATUS_RECHECK
+            ):
+                try:
+                    fetched = await self.get_results(job_id)
+                except JobError:
+                    # 202: still finalizing, check again next tick
+                    finalizing_ticks += 1
+                    return last_status
+                except LeapOCRError:
+                    # Any other error: the status endpoint says whether the job failed
+                    pass
+                else:
+                    if fetched.status == JobStatusType.COMPLETED:
+                        result = fetched
+                        return dataclasses.replace(last_status, status=fetched.status)
+                    # Finished without completing: the status carries the error message
+
+            finalizing_ticks = 0
+            last_status = await self.get_job_status(job_id)
+            return last_status
 
         await poll_until_done(get_status, job_id, poll_opts)
-        return await self.get_results(job_id)
+        return result if result is not None else await self.get_results(job_id)
+
+    async def wait_until_all_done(
+        self,
+        job_ids: list[str],
+        poll_options: PollOptions | None = None,
+        *,
+        max_concurrent: int = 20,
+    ) -> list[JobResult]:
+        """Wait for several jobs to complete and return their results.
+
+        All in-flight jobs are checked together on one polling schedule: each
+        tick sends one status request per unfinished job and then shares a
+        single sleep, instead of running a separate timer per job. The number
+        of status requests is the same as calling wait_until_done() per job.
+
+        Args:
+            job_ids: Job IDs to wait for
+            poll_options: Polling configuration (interval, max_wait, callbacks)
+            max_concurrent: Maximum status and result requests in flight at once
+                (default: 20)
+
+        Returns:
+            JobResults in the same order as job_ids
+
+        Raises:
+            JobTimeoutError: If any job doesn't complete in time
+            JobFailedError: If any job fails
+            ValueError: If max_concurrent is less than 1
+        """
+        poll_opts = poll_options or DEFAULT_POLL_OPTIONS
+        get_status, get_results = self._bounded_job_calls(max_concurrent)
+
+        await poll_many_until_done(get_status, job_ids, poll_opts)
+        return await gather_or_cancel(*(get_results(job_id) for job_id in job_ids))
+
+    async def iter_results(
+        self,
+        job_ids: list[str],
+        poll_options: PollOptions | None = None,
+        *,
+        max_concurrent: int = 20,
+    ) -> AsyncIterator[JobResult]:
+        """Yield job results as each job completes.
+
+        Unlike wait_until_all_done(), results are available as soon as their
+        job finishes, so downstream work can overlap with jobs still running.
+        All in-flight jobs share one polling schedule.
+
+        Args:
+            job_ids: Job IDs to wait for
+            poll_options: Polling configuration (interval, max_wait, callbacks)
+            max_concurrent: Maximum status and result requests in flight at once
+                (default: 20)
+
+        Yields:
+            JobResults in completion order
+
+        Raises:
+            JobTimeoutError: If any job doesn't complete in time
+            JobFailedError: If any job fails
+            ValueError: If max_concurrent is less than 1
+        """
+        poll_opts = poll_options or DEFAULT_POLL_OPTIONS
+        get_status, get_results = self._bounded_job_calls(max_concurrent)
+
+        async for job_id in iter_completed(get_status, job_ids, poll_opts):
+            yield await get_results(job_id)
+
+    def _bounded_job_calls(
+        self, max_concurrent: int
+    ) -> tuple[
+        Callable[[str], Awaitable[JobStatus]],
+        Callable[[str], Awaitable[JobResult]],
+    ]:
+        """Wrap get_job_status() and get_results() in one shared semaphore.
+
+        Polling many jobs at once would otherwise send one request per job per
+        tick, far beyond what the connection pool can serve concurrently.
+
+        Args:
+            max_concurrent: Maximum requests in flight at once
+
+        Returns:
+            Bounded status and result functions
+
+        Raises:
+            ValueError: If max_concurrent is less than 1
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def get_status(job_id: str) -> JobStatus:
+            async with semaphore:
+                return await self.get_job_status(job_id)
+
+        async def get_results(job_id: str) -> JobResult:
+            async with semaphore:
+                return await self.get_results(job_id)
+
+        return get_status, get_results
 
     async def _upload_file(
         self, file: BinaryIO, file_name: str, file_size: int, options: ProcessOptions
@@ -317,38 +698,30 @@ class OCRService:
         Returns:
             ProcessResult with job ID
         """
+        # Reuse the job from an identical earlier upload when caching is enabled
+        cache = self._config.cache
+        key: str | None = None
+        if cache is not None:
+            # Hashing reads the whole file; do it in a worker thread so other
+            # uploads and polls keep running on the event loop meanwhile
+            key = cache_key(await asyncio.to_thread(file_digest, file), options)
+            cached = cache.get(key)
+            if cached is not None:
+                current = await self._refresh_cached(cache, cached)
+                if current is not None:
+                    return current
+
         # Step 1: Initiate upload and get presigned URLs
-        initiate_payload: dict[str, Any] = {
+        initiate_payload = {
             "file_name": file_name,
             "file_size": file_size,
             "content_type": guess_content_type(file_name),
-            "format": options.format.value,
+            **_options_payload(options),
         }
-
-        # Add optional fields
-        if options.model:
-            initiate_payload["model"] = (
-                options.model.value if isinstance(options.model, Model) else options.model
-            )
-        if options.schema:
-            initiate_payload["schema"] = options.schema
-        if options.instructions:
-            initiate_payload["instructions"] = options.instructions
-        if options.template_slug:
-            initiate_payload["template_slug"] = options.template_slug
-
-        async def _initiate() -> httpx.Response:
-            return await self._client.post("/ocr/uploads/direct", json=initiate_payload)
-
-        response = await with_retry(
-            _initiate,
-            max_retries=self._config.max_retries,
-            retry_delay=self._config.retry_delay,
-            retry_multiplier=self._config.retry_multiplier,
-        )
+        response = await self._request("POST", "/ocr/uploads/direct", payload=initiate_payload)
 
         self._check_response(response)
-        upload_data = response.json()
+        upload_data = loads(response.content)
 
         job_id = upload_data["job_id"]
         parts = upload_data["parts"]
@@ -357,27 +730,113 @@ class OCRService:
         completed_parts = await self._uploader.upload_multipart(file, parts)
 
         # Step 3: Complete the upload
-        async def _complete() -> httpx.Response:
-            return await self._client.post(
-                f"/ocr/uploads/{job_id}/complete", json={"parts": completed_parts}
-            )
-
-        complete_response = await with_retry(
-            _complete,
-            max_retries=self._config.max_retries,
-            retry_delay=self._config.retry_delay,
-            retry_multiplier=self._config.retry_multiplier,
+        complete_response = await self._request(
+            "POST", f"/ocr/uploads/{job_id}/complete", payload={"parts": completed_parts}
         )
 
         self._check_response(complete_response)
-        complete_data = complete_response.json()
+        complete_data = loads(complete_response.content)
 
-        return ProcessResult(
+        result = ProcessResult(
             job_id=job_id,
-            status=JobStatusType(complete_data.get("status", "pending")),
+            status=parse_job_status(complete_data.get("status", "pending")),
             created_at=parse_datetime(complete_data["created_at"]),
         )
 
+        if cache is not None and key is not None:
+            cache.set(key, result)
+        return result
+
+    async def _refresh_cached(
+        self, cache: ResultCache, cached: ProcessResult
+    ) -> ProcessResult | None:
+        """Check that a cached job can still be reused.
+
+        Args:
+            cache: Cache the job was found in
+            cached: Cached job
+
+        Returns:
+            The job with its current status, or None if it failed or no longer
+            exists (the entry is then dropped from the cache)
+        """
+        try:
+            status = await self.get_job_status(cached.job_id)
+        except APIError as e:
+            if e.status_code != 404:
+                raise
+            status = None
+
+        if status is None or status.status == JobStatusType.FAILED:
+            cache.discard_job(cached.job_id)
+            return None
+        return ProcessResult(
+            job_id=cached.job_id, status=status.status, created_at=cached.created_at
+        )
+
+    async def _request(
+        self, method: str, url: str, payload: Any = None, **kwargs: Any
+    ) -> httpx.Response:
+        """Send an API request with client-side rate limiting and retry.
+
+        Each attempt waits for a rate limiter token (when ``rate_limit`` is
+        configured), so requests are paced below the server's limit rather
+        than rejected and retried. The limiter also follows the server's
+        ``Retry-After`` and ``X-RateLimit-Remaining`` headers. 429 and 5xx
+        responses are retried with exponential backoff (or the server's
+        ``Retry-After``) as a safety net; the typed error is raised once
+        retries are exhausted.
+
+        Args:
+            method: HTTP method
+            url: Request path relative to the API base URL
+            payload: Optional JSON body, serialized once before the first attempt
+            **kwargs: Extra arguments passed to ``httpx.AsyncClient.request``
+
+        Returns:
+            HTTP response
+        """
+        headers = self._headers
+        if payload is not None:
+            kwargs["content"] = dumps(payload)
+            # Set explicitly: unlike json=, content= adds no Content-Type, and a
+            # borrowed http_client has no default headers to fall back on
+            headers = self._json_headers
+        if headers:
+            kwargs["headers"] = headers
+
+        async def _make_request() -> httpx.Response:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            response = await self._next_client().request(method, url, **kwargs)
+            if self._rate_limiter is not None:
+                self._adjust_rate_limiter(self._rate_limiter, response)
+            if response.status_code in _RETRYABLE_STATUSES:
+                # Raises RateLimitError / APIError, which with_retry retries
+                self._check_response(response)
+            return response
+
+        return await with_retry(
+            _make_request,
+            max_retries=self._config.max_retries,
+            retry_delay=self._config.retry_delay,
+            retry_multiplier=self._config.retry_multiplier,
+        )
+
+    @staticmethod
+    def _adjust_rate_limiter(limiter: TokenBucket, response: httpx.Response) -> None:
+        """Slow the client-side limiter down when the server asks for it.
+
+        Args:
+            limiter: Token bucket shared by this service's requests
+            response: Response whose rate limit headers are applied
+        """
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after:
+            limiter.pause(retry_after)
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            limiter.drain()
+
     def _check_response(self, response: httpx.Response) -> None:
         """Check response for errors and raise appropriate exceptions.
 
@@ -385,16 +844,29 @@ class OCRService:
             response: HTTP response to check
 
         Raises:
-            APIError: If response indicates an error
+            ValidationError: On 400 Bad Request
+            AuthenticationError: On 401 Unauthorized
+            InsufficientCreditsError: On 402 Payment Required
+            RateLimitError: On 429 Too Many Requests
+            APIError: On any other error status
         """
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
             # Try to extract error message from response
             try:
-                error_data = response.json()
+                error_data = loads(response.content)
                 message = error_data.get("error", {}).get("message", str(e))
             except Exception:
                 message = str(e)
 
-            raise APIError(message, status_code=response.status_code, response=response.text)
+            factory = _ERROR_FACTORIES.get(response.status_code)
+            if factory is not None:
+                raise factory(message, response)
+            raise APIError(
+                message,
+                status_code=response.status_code,
+                response=response.text,
+                # Sent with 503 Service Unavailable; with_retry waits this long
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
@@ -0,0 +1,130 @@
+"""Unit tests for the content-addressed job cache."""
+
+import io
+import os
+import time
+from datetime import datetime
+
+from leapocr.cache import DiskCache, MemoryCache, cache_key, file_digest
+from leapocr.models import Format, JobStatusType, Model, ProcessOptions, ProcessResult
+
+
+def make_result(job_id: str = "job-123") -> ProcessResult:
+    return ProcessResult(
+        job_id=job_id,
+        status=JobStatusType.PENDING,
+        created_at=datetime(2024, 1, 15, 10, 30),
+    )
+
+
+class TestFileDigest:
+    """Tests for file content hashing."""
+
+    def test_same_content_same_digest(self):
+        assert file_digest(io.BytesIO(b"%PDF-1.4")) == file_digest(io.BytesIO(b"%PDF-1.4"))
+
+    def test_different_content_different_digest(self):
+        assert file_digest(io.BytesIO(b"a")) != file_digest(io.BytesIO(b"b"))
+
+    def test_restores_position(self):
+        file = io.BytesIO(b"%PDF-1.4 content")
+        file.seek(4)
+        file_digest(file)
+        assert file.tell() == 4
+
+
+class TestCacheKey:
+    """Tests for cache key construction."""
+
+    def test_same_options_same_key(self):
+        assert cache_key("abc", ProcessOptions()) == cache_key("abc", ProcessOptions())
+
+    def test_options_change_key(self):
+        base = cache_key("abc", ProcessOptions())
+        assert cache_key("abc", ProcessOptions(format=Format.MARKDOWN)) != base
+        assert cache_key("abc", ProcessOptions(model=Model.PRO_V1)) != base
+        assert cache_key("abc", ProcessOptions(instructions="Extract totals")) != base
+
+    def test_model_enum_and_string_match(self):
+        assert cache_key("abc", ProcessOptions(model=Model.PRO_V1)) == cache_key(
+            "abc", ProcessOptions(model="pro-v1")
+        )
+
+    def test_metadata_ignored(self):
+        assert cache_key("abc", ProcessOptions(metadata={"user": "1"})) == cache_key(
+            "abc", ProcessOptions()
+        )
+
+
+class TestMemoryCache:
+    """Tests for MemoryCache."""
+
+    def test_miss(self):
+        assert MemoryCache().get("missing") is None
+
+    def test_set_and_get(self):
+        cache = MemoryCache()
+        cache.set("key", make_result())
+        assert cache.get("key") == make_result()
+
+    def test_discard_job(self):
+        cache = MemoryCache()
+        cache.set("a", make_result("job-1"))
+        cache.set("b", make_result("job-2"))
+
+        cache.discard_job("job-1")
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+    def test_ttl_expires_entries(self):
+        cache = MemoryCache(ttl=0.01)
+        cache.set("key", make_result())
+        time.sleep(0.02)
+        assert cache.get("key") is None
+
+    def test_ttl_keeps_fresh_entries(self):
+        cache = MemoryCache(ttl=60)
+        cache.set("key", make_result())
+        assert cache.get("key") == make_result()
+
+
+class TestDiskCache:
+    """Tests for DiskCache."""
+
+    def test_miss(self, tmp_path):
+        assert DiskCache(tmp_path).get("missing") is None
+
+    def test_round_trip(self, tmp_path):
+        DiskCache(tmp_path).set("key", make_result())
+        assert DiskCache(tmp_path).get("key") == make_result()
+
+    def test_discard_job(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.set("a", make_result("job-1"))
+        cache.set("b", make_result("job-2"))
+
+        cache.discard_job("job-1")
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+    def test_creates_directory(self, tmp_path):
+        directory = tmp_path / "nested" / "cache"
+        DiskCache(directory)
+        assert directory.is_dir()
+
+    def test_ttl_expires_entries(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set("key", make_result())
+        path = cache._path("key")
+        old = time.time() - 120
+        os.utime(path, (old, old))
+
+        assert cache.get("key") is None
+        assert not path.exists()
+
+    def test_ttl_keeps_fresh_entries(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set("key", make_result())
+        assert cache.get("key") == make_result()
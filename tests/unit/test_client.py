@@ -0,0 +1,221 @@
+"""Unit tests for the LeapOCR client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from leapocr import AuthenticationError, ClientConfig, LeapOCR, ValidationError
+from leapocr.ocr import OCRService
+
+
+@pytest.fixture
+async def client():
+    """A default client for tests that only inspect it; closed on teardown."""
+    client = LeapOCR("test-key")
+    yield client
+    await client.close()
+
+
+class TestClientInit:
+    """Tests for LeapOCR construction."""
+
+    @pytest.mark.parametrize("api_key", ["", "   ", "\t\n"])
+    def test_rejects_blank_api_key(self, api_key):
+        with pytest.raises(AuthenticationError):
+            LeapOCR(api_key)
+
+    @pytest.mark.parametrize(
+        "base_url", ["api.leapocr.com/api/v1", "ftp://api.leapocr.com", "https://", "http://[::1"]
+    )
+    def test_rejects_invalid_base_url(self, base_url):
+        with pytest.raises(ValidationError) as exc_info:
+            LeapOCR("test-key", ClientConfig(base_url=base_url))
+
+        assert exc_info.value.field == "base_url"
+
+    def test_malformed_base_url_keeps_cause(self):
+        with pytest.raises(ValidationError) as exc_info:
+            LeapOCR("test-key", ClientConfig(base_url="http://[::1"))
+
+        assert isinstance(exc_info.value.__cause__, httpx.InvalidURL)
+
+    def test_accepts_api_key(self, client):
+        assert client.api_key == "test-key"
+
+    async def test_upload_client_created_lazily(self):
+        client = LeapOCR("test-key")
+        assert "_uploader" not in vars(client.ocr)
+
+        uploader = client.ocr._uploader
+        assert client.ocr._uploader is uploader
+
+        await client.close()
+        assert uploader._s3_client.is_closed
+
+    def test_upload_client_has_no_credentials(self, client):
+        """Presigned storage URLs carry their own signature; API auth must not leak."""
+        assert "X-API-KEY" in client._http_client.headers
+        upload_headers = client.ocr._uploader._s3_client.headers
+        assert "X-API-KEY" not in upload_headers
+        assert "Authorization" not in upload_headers
+
+
+class TestPrewarm:
+    """Tests for connection pre-warming."""
+
+    @staticmethod
+    def make_config(requests: list, prewarm: bool) -> ClientConfig:
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            return httpx.Response(200)
+
+        http_client = httpx.AsyncClient(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+        return ClientConfig(http_client=http_client, prewarm=prewarm)
+
+    async def test_prewarm_issues_health_check(self):
+        requests: list = []
+        async with LeapOCR("test-key", self.make_config(requests, prewarm=True)) as client:
+            assert client._prewarm_task is not None
+            assert await client._prewarm_task is True
+
+        assert requests == ["/health"]
+
+    async def test_exit_during_prewarm_cancels_and_awaits(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(10)
+            return httpx.Response(200)
+
+        http_client = httpx.AsyncClient(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+        async with LeapOCR(
+            "test-key", ClientConfig(http_client=http_client, prewarm=True)
+        ) as client:
+            task = client._prewarm_task
+            assert task is not None
+            await asyncio.sleep(0)  # let the health check reach the transport
+
+        assert task.cancelled()
+        await http_client.aclose()
+
+    async def test_no_prewarm_by_default(self):
+        requests: list = []
+        async with LeapOCR("test-key", self.make_config(requests, prewarm=False)) as client:
+            assert client._prewarm_task is None
+
+        assert requests == []
+
+    async def test_prewarm_warms_extra_clients(self):
+        requests: list = []
+        extra_requests: list = []
+        config = self.make_config(requests, prewarm=True)
+        extra = self.make_config(extra_requests, prewarm=False).http_client
+        assert extra is not None
+
+        client = LeapOCR("test-key", config)
+        client._extra_http_clients = [extra]
+        async with client:
+            assert client._prewarm_task is not None
+            assert await client._prewarm_task is True
+
+        assert requests == ["/health"]
+        assert extra_requests == ["/health"]
+
+
+class TestSharedHttpClient:
+    """Tests for borrowing an HTTP client through ClientConfig."""
+
+    @staticmethod
+    def make_shared(seen: list) -> httpx.AsyncClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("X-API-KEY"))
+            return httpx.Response(200, json={"ok": True})
+
+        return httpx.AsyncClient(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+
+    async def test_shared_client_left_open(self):
+        shared = self.make_shared([])
+        async with LeapOCR("test-key", ClientConfig(http_client=shared)):
+            pass
+
+        assert not shared.is_closed
+        await shared.aclose()
+
+    async def test_owned_client_closed(self):
+        client = LeapOCR("test-key")
+        await client.close()
+
+        assert client._http_client.is_closed
+
+    async def test_each_instance_sends_its_own_key(self):
+        seen: list = []
+        shared = self.make_shared(seen)
+        client_a = LeapOCR("key-a", ClientConfig(http_client=shared))
+        client_b = LeapOCR("key-b", ClientConfig(http_client=shared))
+
+        await client_a.ocr.delete_job("job-1")
+        await client_b.ocr.delete_job("job-2")
+
+        assert seen == ["key-a", "key-b"]
+        await client_a.close()
+        await client_b.close()
+        await shared.aclose()
+
+    async def test_json_body_has_content_type(self):
+        seen: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("Content-Type"))
+            return httpx.Response(
+                200,
+                json={"job_id": "job-1", "status": "pending", "created_at": "2024-01-15T10:30:00Z"},
+            )
+
+        shared = httpx.AsyncClient(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+        async with LeapOCR("test-key", ClientConfig(http_client=shared)) as client:
+            await client.ocr.process_url("https://example.com/doc.pdf")
+
+        assert seen == ["application/json"]
+        await shared.aclose()
+
+
+class TestHttp2Connections:
+    """Tests for spreading requests across several HTTP/2 connections."""
+
+    async def test_extra_clients_only_with_http2(self):
+        client = LeapOCR("test-key", ClientConfig(http2_connections=4))
+        assert client._extra_http_clients == []
+        await client.close()
+
+    async def test_requests_round_robin(self):
+        used: list = []
+
+        def make_handler(index: int):
+            def handler(request: httpx.Request) -> httpx.Response:
+                used.append(index)
+                return httpx.Response(200, json={"ok": True})
+
+            return handler
+
+        clients = [
+            httpx.AsyncClient(
+                base_url="https://api.test", transport=httpx.MockTransport(make_handler(i))
+            )
+            for i in range(3)
+        ]
+        service = OCRService(clients[0], ClientConfig(), extra_http_clients=clients[1:])
+
+        for _ in range(4):
+            await service.delete_job("job-1")
+
+        assert used == [0, 1, 2, 0]
+        await service._close_uploader()
+        for http_client in clients:
+            await http_client.aclose()
@@ -0,0 +1,34 @@
+"""Unit tests for client configuration."""
+
+import httpx
+
+from leapocr.config import ClientConfig
+
+
+class TestClientConfig:
+    """Tests for ClientConfig defaults and derived settings."""
+
+    def test_default_config(self):
+        config = ClientConfig()
+        assert config.base_url == "https://api.leapocr.com/api/v1"
+        assert config.timeout == 30.0
+        assert config.rate_limit is None
+        assert config.http2 is False
+        assert config.prewarm is False
+        assert config.http2_connections == 1
+
+    def test_default_limits(self):
+        limits = ClientConfig().limits
+        assert isinstance(limits, httpx.Limits)
+        assert limits.max_connections == 100
+        assert limits.max_keepalive_connections == 100
+        assert limits.keepalive_expiry == 30.0
+
+    def test_custom_limits(self):
+        config = ClientConfig(
+            max_connections=200, max_keepalive_connections=50, keepalive_expiry=60.0
+        )
+        limits = config.limits
+        assert limits.max_connections == 200
+        assert limits.max_keepalive_connections == 50
+        assert limits.keepalive_expiry == 60.0
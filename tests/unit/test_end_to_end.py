@@ -0,0 +1,169 @@
+"""End-to-end tests for the LeapOCR SDK against a fake server.
+
+These run the same flows as the live integration tests (upload, poll, fetch
+results, delete) through the public client, against an in-process fake of the
+API and storage servers served by ``httpx.MockTransport``. They need no API
+key or network access, so they run with the unit tests.
+"""
+
+import json
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from leapocr import Format, JobStatusType, LeapOCR, PollOptions, ProcessOptions
+from leapocr.config import ClientConfig
+from leapocr.errors import JobFailedError
+
+CREATED_AT = "2024-01-15T10:30:00Z"
+FAST_POLL = PollOptions(poll_interval=0.001, max_interval=0.001, jitter=0.0)
+
+
+class FakeServer:
+    """In-memory stand-in for the LeapOCR API and presigned storage URLs."""
+
+    def __init__(self, polls_until_done: int = 1, fail: bool = False):
+        self.polls_until_done = polls_until_done
+        self.fail = fail
+        self.jobs: dict[str, dict] = {}
+        self.uploaded: dict[str, bytes] = {}
+        self.requests: list[tuple[str, str]] = []
+
+    def _new_job(self, name: str, body: dict) -> str:
+        job_id = f"job-{len(self.jobs) + 1}"
+        self.jobs[job_id] = {"name": name, "polls": 0, "format": body.get("format")}
+        return job_id
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.path))
+        if request.url.host == "storage.test":
+            key = request.url.path.rsplit("/", 1)[-1]
+            self.uploaded[key] = self.uploaded.get(key, b"") + request.read()
+            return httpx.Response(200, headers={"ETag": f'"etag-{key}"'})
+
+        path = request.url.path.removeprefix("/api/v1")
+        parts = path.strip("/").split("/")
+        if request.method == "POST" and path == "/ocr/uploads/url":
+            body = json.loads(request.content)
+            job_id = self._new_job(body["url"], body)
+            return httpx.Response(
+                200, json={"job_id": job_id, "status": "pending", "created_at": CREATED_AT}
+            )
+        if request.method == "POST" and path == "/ocr/uploads/direct":
+            body = json.loads(request.content)
+            job_id = self._new_job(body["file_name"], body)
+            return httpx.Response(
+                200,
+                json={
+                    "job_id": job_id,
+                    "parts": [
+                        {
+                            "part_number": 1,
+                            "start_byte": 0,
+                            "end_byte": body["file_size"] - 1,
+                            "upload_url": f"https://storage.test/{job_id}",
+                        }
+                    ],
+                },
+            )
+        if request.method == "POST" and parts[-1] == "complete":
+            return httpx.Response(200, json={"status": "pending", "created_at": CREATED_AT})
+        if request.method == "GET" and parts[:2] == ["ocr", "status"]:
+            job = self.jobs[parts[2]]
+            job["polls"] += 1
+            if self.fail:
+                status = "failed"
+            elif job["polls"] >= self.polls_until_done:
+                status = "completed"
+            else:
+                status = "processing"
+            return httpx.Response(
+                200,
+                json={
+                    "id": parts[2],
+                    "status": status,
+                    "processed_pages": 1 if status == "completed" else 0,
+                    "total_pages": 1,
+                    "created_at": CREATED_AT,
+                    "error_message": "corrupt PDF" if self.fail else None,
+                },
+            )
+        if request.method == "GET" and parts[:2] == ["ocr", "result"]:
+            job = self.jobs[parts[2]]
+            return httpx.Response(
+                200,
+                json={
+                    "job_id": parts[2],
+                    "status": "completed",
+                    "pages": [{"page_number": 1, "result": f"text of {job['name']}"}],
+                    "file_name": job["name"],
+                    "total_pages": 1,
+                    "processed_pages": 1,
+                    "credits_used": 1,
+                    "model": "standard-v1",
+                    "result_format": job["format"],
+                    "completed_at": CREATED_AT,
+                },
+            )
+        if request.method == "DELETE" and parts[:2] == ["ocr", "delete"]:
+            self.jobs.pop(parts[2], None)
+            return httpx.Response(200, json={"deleted": True})
+        return httpx.Response(404, json={"error": {"message": f"no route for {path}"}})
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer(polls_until_done=2)
+
+
+@pytest.fixture
+async def client(server: FakeServer) -> AsyncIterator[LeapOCR]:
+    transport = httpx.MockTransport(server.handler)
+    api = httpx.AsyncClient(base_url="https://api.test/api/v1", transport=transport)
+    client = LeapOCR("test-key", ClientConfig(http_client=api, retry_delay=0.0))
+    # Presigned part uploads go through the uploader's own client
+    await client.ocr._uploader.close()
+    client.ocr._uploader._s3_client = httpx.AsyncClient(transport=transport)
+    async with client:
+        yield client
+    await api.aclose()
+
+
+class TestOfflineFlows:
+    """End-to-end flows against the fake server."""
+
+    async def test_file_upload_to_results(self, client, server, tmp_path):
+        path = tmp_path / "invoice.pdf"
+        path.write_bytes(b"%PDF-1.4 fake invoice")
+
+        job = await client.ocr.process_file(path, ProcessOptions(format=Format.MARKDOWN))
+        result = await client.ocr.wait_until_done(job.job_id, FAST_POLL)
+
+        assert server.uploaded[job.job_id] == b"%PDF-1.4 fake invoice"
+        assert result.status == JobStatusType.COMPLETED
+        assert result.result_format == "markdown"
+        assert result.pages[0].result == "text of invoice.pdf"
+
+    async def test_url_batch_to_results(self, client):
+        urls = [f"https://example.com/doc-{i}.pdf" for i in range(3)]
+
+        jobs = await client.ocr.process_batch(urls)
+        results = await client.ocr.wait_until_all_done([job.job_id for job in jobs], FAST_POLL)
+
+        assert [r.file_name for r in results] == urls
+
+    async def test_failed_job_raises(self, client, server):
+        server.fail = True
+        job = await client.ocr.process_url("https://example.com/broken.pdf")
+
+        with pytest.raises(JobFailedError, match="corrupt PDF"):
+            await client.ocr.wait_until_done(job.job_id, FAST_POLL)
+
+    async def test_delete_job(self, client, server):
+        job = await client.ocr.process_url("https://example.com/doc.pdf")
+
+        await client.ocr.delete_job(job.job_id)
+
+        assert job.job_id not in server.jobs
+        assert server.requests[-1] == ("DELETE", f"/api/v1/ocr/delete/{job.job_id}")
@@ -1,5 +1,7 @@
 """Unit tests for error classes."""
 
+import pickle
+
 import pytest
 
 from leapocr.errors import (
@@ -231,3 +233,67 @@ class TestErrorHierarchy:
         # Can catch job subclass as JobError
         with pytest.raises(JobError):
             raise JobFailedError("test", job_id="123")
+
+
+class TestErrorSlots:
+    """Tests for slotted error attributes."""
+
+    def test_attributes_do_not_use_instance_dict(self):
+        err = FileError("test", file_path="/test", file_size=10)
+        assert err.__dict__ == {}
+
+    @pytest.mark.parametrize(
+        "error_class",
+        [
+            LeapOCRError,
+            AuthenticationError,
+            RateLimitError,
+            ValidationError,
+            FileError,
+            JobError,
+            JobFailedError,
+            JobTimeoutError,
+            NetworkError,
+            APIError,
+            InsufficientCreditsError,
+        ],
+    )
+    def test_every_class_declares_slots(self, error_class):
+        # A subclass without __slots__ silently brings the per-instance dict back
+        assert "__slots__" in vars(error_class)
+
+    def test_pickle_preserves_slot_attributes(self):
+        err = RateLimitError("slow down", retry_after=30)
+        restored = pickle.loads(pickle.dumps(err))
+
+        assert isinstance(restored, RateLimitError)
+        assert restored.message == "slow down"
+        assert restored.retry_after == 30
+        assert restored.status_code == 429
+
+    @pytest.mark.parametrize(
+        "err",
+        [
+            LeapOCRError("boom", code="x", status_code=418, details={"a": 1}),
+            AuthenticationError(),
+            RateLimitError("slow down", retry_after=30),
+            ValidationError("bad", field="model"),
+            FileError("missing", file_path="a.pdf", file_size=10),
+            JobError("oops", job_id="job-1"),
+            JobFailedError("failed", job_id="job-1", error_details="corrupt"),
+            JobTimeoutError("timeout", job_id="job-1"),
+            NetworkError("offline"),
+            APIError("server error", status_code=503, response="body"),
+            InsufficientCreditsError(credits_available=1, credits_required=5),
+        ],
+        ids=lambda err: type(err).__name__,
+    )
+    def test_pickle_round_trip_every_error(self, err):
+        restored = pickle.loads(pickle.dumps(err))
+
+        assert type(restored) is type(err)
+        assert restored.args == err.args
+        assert str(restored) == str(err)
+        for cls in type(err).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                assert getattr(restored, name) == getattr(err, name)
@@ -0,0 +1,24 @@
+"""Unit tests for optional event loop setup."""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+
+from leapocr._internal.event_loop import install_uvloop
+
+
+class TestInstallUvloop:
+    """Tests for optional uvloop installation."""
+
+    def test_returns_false_when_unavailable(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        assert install_uvloop() is False
+
+    def test_sets_event_loop_policy(self, monkeypatch):
+        policy = object()
+        policies = []
+        monkeypatch.setitem(sys.modules, "uvloop", SimpleNamespace(EventLoopPolicy=lambda: policy))
+        monkeypatch.setattr(asyncio, "set_event_loop_policy", policies.append)
+
+        assert install_uvloop() is True
+        assert policies == [policy]
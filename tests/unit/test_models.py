@@ -1,7 +1,11 @@
 """Unit tests for data models."""
 
+import dataclasses
+import sys
 from datetime import datetime
 
+import pytest
+
 from leapocr.models import (
     Format,
     JobResult,
@@ -16,14 +20,33 @@ from leapocr.models import (
 )
 
 
+class TestEnumValues:
+    """Tests for the wire values of the public enums."""
+
+    @pytest.mark.parametrize(
+        ("member", "value"),
+        [
+            (Format.MARKDOWN, "markdown"),
+            (Format.STRUCTURED, "structured"),
+            (Format.PER_PAGE_STRUCTURED, "per_page_structured"),
+            (Model.STANDARD_V1, "standard-v1"),
+            (Model.ENGLISH_PRO_V1, "english-pro-v1"),
+            (Model.PRO_V1, "pro-v1"),
+            (JobStatusType.PENDING, "pending"),
+            (JobStatusType.UPLOADING, "uploading"),
+            (JobStatusType.PROCESSING, "processing"),
+            (JobStatusType.COMPLETED, "completed"),
+            (JobStatusType.PARTIALLY_DONE, "partially_done"),
+            (JobStatusType.FAILED, "failed"),
+        ],
+    )
+    def test_value(self, member, value):
+        assert member.value == value
+
+
 class TestFormatEnum:
     """Tests for Format enum."""
 
-    def test_format_values(self):
-        assert Format.MARKDOWN.value == "markdown"
-        assert Format.STRUCTURED.value == "structured"
-        assert Format.PER_PAGE_STRUCTURED.value == "per_page_structured"
-
     def test_format_comparison(self):
         assert Format.MARKDOWN == Format.MARKDOWN
         assert Format.MARKDOWN != Format.STRUCTURED
@@ -37,11 +60,6 @@ class TestFormatEnum:
 class TestModelEnum:
     """Tests for Model enum."""
 
-    def test_model_values(self):
-        assert Model.STANDARD_V1.value == "standard-v1"
-        assert Model.ENGLISH_PRO_V1.value == "english-pro-v1"
-        assert Model.PRO_V1.value == "pro-v1"
-
     def test_model_comparison(self):
         assert Model.STANDARD_V1 == Model.STANDARD_V1
         assert Model.ENGLISH_PRO_V1 == Model.ENGLISH_PRO_V1
@@ -58,14 +76,6 @@ class TestModelEnum:
 class TestJobStatusType:
     """Tests for JobStatusType enum."""
 
-    def test_status_values(self):
-        assert JobStatusType.PENDING.value == "pending"
-        assert JobStatusType.UPLOADING.value == "uploading"
-        assert JobStatusType.PROCESSING.value == "processing"
-        assert JobStatusType.COMPLETED.value == "completed"
-        assert JobStatusType.PARTIALLY_DONE.value == "partially_done"
-        assert JobStatusType.FAILED.value == "failed"
-
     def test_all_statuses_defined(self):
         """Ensure all expected status types exist."""
         expected = ["pending", "uploading", "processing", "completed", "partially_done", "failed"]
@@ -137,6 +147,9 @@ class TestPollOptions:
         assert opts.poll_interval == 2.0
         assert opts.max_wait == 300.0
         assert opts.on_progress is None
+        assert opts.backoff_multiplier == 1.5
+        assert opts.max_interval == 10.0
+        assert opts.jitter == 0.1
 
     def test_custom_poll_options(self):
         def progress_callback(status):
@@ -258,6 +271,23 @@ class TestPageResult:
 
         assert page.id == "page-abc123"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require 3.10+")
+    def test_page_result_uses_slots(self):
+        page = PageResult(page_number=1, result="Content")
+
+        assert not hasattr(page, "__dict__")
+
+    def test_page_result_is_frozen(self):
+        page = PageResult(page_number=1, result="Content")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            page.result = "Changed"  # type: ignore[misc]
+
+    def test_page_result_is_hashable(self):
+        page = PageResult(page_number=1, result="Content", id="page-1")
+
+        assert hash(page) == hash(PageResult(page_number=1, result="Content", id="page-1"))
+
 
 class TestPaginationInfo:
     """Tests for PaginationInfo dataclass."""
@@ -270,6 +300,12 @@ class TestPaginationInfo:
         assert pagination.total == 250
         assert pagination.total_pages == 5
 
+    def test_pagination_info_is_frozen(self):
+        pagination = PaginationInfo(page=1, limit=50, total=10, total_pages=1)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pagination.page = 2  # type: ignore[misc]
+
 
 class TestJobResult:
     """Tests for JobResult dataclass."""
@@ -0,0 +1,673 @@
+"""Unit tests for the OCR service."""
+
+import asyncio
+import io
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+import pytest
+
+from leapocr import ocr as ocr_module
+from leapocr._internal.retry import is_retryable_error
+from leapocr.cache import MemoryCache, cache_key
+from leapocr.config import ClientConfig
+from leapocr.errors import (
+    APIError,
+    AuthenticationError,
+    FileError,
+    InsufficientCreditsError,
+    JobFailedError,
+    RateLimitError,
+    ValidationError,
+)
+from leapocr.models import (
+    Format,
+    JobStatusType,
+    Model,
+    PageResult,
+    PaginationInfo,
+    PollOptions,
+    ProcessOptions,
+    ProcessResult,
+)
+from leapocr.ocr import _ERROR_FACTORIES, OCRService, _is_url, _options_payload
+
+
+@pytest.fixture
+async def mock_service():
+    """Build OCRServices whose requests are answered by a handler; closed on teardown."""
+    created: list[tuple[OCRService, httpx.AsyncClient]] = []
+
+    def make(handler, config=None):
+        http_client = httpx.AsyncClient(
+            base_url="https://api.test", transport=httpx.MockTransport(handler)
+        )
+        ocr = OCRService(http_client, config or ClientConfig())
+        created.append((ocr, http_client))
+        return ocr
+
+    yield make
+    for ocr, http_client in created:
+        await ocr._close_uploader()
+        await http_client.aclose()
+
+
+@pytest.fixture(scope="module")
+async def service():
+    """One service for tests that never reach the network; don't mutate it outside monkeypatch."""
+    http_client = httpx.AsyncClient(base_url="https://api.test")
+    ocr = OCRService(http_client, ClientConfig())
+    yield ocr
+    await ocr._close_uploader()
+    await http_client.aclose()
+
+
+@pytest.fixture
+def fake_pdf() -> io.BytesIO:
+    """A fresh in-memory PDF per test (buffers carry a read position)."""
+    return io.BytesIO(FAKE_PDF_BYTES)
+
+
+FAKE_PDF_BYTES = b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n"
+
+SUBMITTED_JOB = {"job_id": "job-1", "status": "pending", "created_at": "2024-01-15T10:30:00Z"}
+
+COMPLETED_RESULT = {
+    "job_id": "job-1",
+    "status": "completed",
+    "pages": [],
+    "file_name": "doc.pdf",
+    "total_pages": 2,
+    "processed_pages": 2,
+    "credits_used": 2,
+    "model": "standard-v1",
+    "result_format": "structured",
+    "completed_at": "2024-01-15T10:31:00Z",
+}
+
+
+def error_response(status_code: int, headers=None) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        json={"error": {"message": "something went wrong"}},
+        headers=headers,
+        request=httpx.Request("GET", "https://api.test/ocr/status/job-1"),
+    )
+
+
+def track_in_flight(respond):
+    """Wrap respond in a handler that holds each request briefly, counting concurrent ones.
+
+    Returns the handler and a dict whose "peak" is the most requests seen in flight at once.
+    """
+    in_flight = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return respond(request)
+
+    return handler, in_flight
+
+
+class TestOptionsPayload:
+    """Tests for building request payloads from ProcessOptions."""
+
+    def test_defaults(self):
+        assert _options_payload(ProcessOptions()) == {"format": "structured"}
+
+    def test_model_enum_converted(self):
+        payload = _options_payload(ProcessOptions(model=Model.PRO_V1))
+        assert payload["model"] == "pro-v1"
+        assert type(payload["model"]) is str
+
+    def test_custom_model_string(self):
+        assert _options_payload(ProcessOptions(model="custom-v2"))["model"] == "custom-v2"
+
+    def test_optional_fields(self):
+        options = ProcessOptions(
+            format=Format.MARKDOWN,
+            schema={"type": "object"},
+            instructions="Extract totals",
+            template_slug="invoice",
+        )
+        assert _options_payload(options) == {
+            "format": "markdown",
+            "schema": {"type": "object"},
+            "instructions": "Extract totals",
+            "template_slug": "invoice",
+        }
+
+
+class TestCheckResponse:
+    """Tests for mapping error responses to exceptions."""
+
+    def test_success_passes(self, service):
+        response = httpx.Response(200, request=httpx.Request("GET", "https://api.test/health"))
+        service._check_response(response)
+
+    @pytest.mark.parametrize(
+        ("status_code", "error_type"),
+        [
+            (400, ValidationError),
+            (401, AuthenticationError),
+            (402, InsufficientCreditsError),
+            (429, RateLimitError),
+            (404, APIError),
+            (500, APIError),
+        ],
+    )
+    def test_status_maps_to_error(self, service, status_code, error_type):
+        with pytest.raises(error_type) as exc_info:
+            service._check_response(error_response(status_code))
+
+        assert exc_info.value.message == "something went wrong"
+
+    def test_error_map_covers_client_errors(self):
+        assert set(_ERROR_FACTORIES) == {400, 401, 402, 429}
+
+    @pytest.mark.parametrize("status_code", [500, 502, 503])
+    def test_server_errors_retryable(self, service, status_code):
+        with pytest.raises(APIError) as exc_info:
+            service._check_response(error_response(status_code))
+
+        assert is_retryable_error(exc_info.value)
+
+    def test_api_error_keeps_status_and_body(self, service):
+        with pytest.raises(APIError) as exc_info:
+            service._check_response(error_response(503))
+
+        assert exc_info.value.status_code == 503
+        assert "something went wrong" in exc_info.value.response
+
+    def test_rate_limit_retry_after(self, service):
+        with pytest.raises(RateLimitError) as exc_info:
+            service._check_response(error_response(429, headers={"Retry-After": "2.5"}))
+
+        assert exc_info.value.retry_after == 3
+
+    def test_service_unavailable_retry_after(self, service):
+        with pytest.raises(APIError) as exc_info:
+            service._check_response(error_response(503, headers={"Retry-After": "4"}))
+
+        assert exc_info.value.retry_after == 4.0
+
+
+class TestRequestRetry:
+    """Tests for retrying 429 and 5xx responses."""
+
+    def make_service(self, mock_service, statuses, **config_kwargs):
+        calls: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status = statuses[min(len(calls), len(statuses) - 1)]
+            calls.append(status)
+            return httpx.Response(
+                status,
+                json={"error": {"message": "busy"}},
+                headers={"Retry-After": "0"} if status == 429 else None,
+            )
+
+        config = ClientConfig(retry_delay=0.0, **config_kwargs)
+        return mock_service(handler, config), calls
+
+    @pytest.mark.parametrize("status", [429, 503])
+    async def test_retryable_status_then_success(self, mock_service, status):
+        service, calls = self.make_service(mock_service, [status, 200])
+
+        response = await service._request("GET", "/ocr/status/job-1")
+
+        assert response.status_code == 200
+        assert calls == [status, 200]
+
+    async def test_raises_after_retries_exhausted(self, mock_service):
+        service, calls = self.make_service(mock_service, [429], max_retries=2)
+
+        with pytest.raises(RateLimitError):
+            await service._request("GET", "/ocr/status/job-1")
+
+        assert len(calls) == 3
+
+    async def test_client_error_not_retried(self, mock_service):
+        service, calls = self.make_service(mock_service, [404, 200])
+
+        response = await service._request("GET", "/ocr/status/job-1")
+
+        assert response.status_code == 404
+        assert calls == [404]
+
+
+class TestCachedJobRefresh:
+    """Tests for checking cached jobs before reusing them."""
+
+    def make_service(self, mock_service, status_code, job_status="completed"):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                status_code,
+                json={
+                    "id": "job-1",
+                    "status": job_status,
+                    "created_at": "2024-01-15T10:30:00Z",
+                },
+            )
+
+        cache = MemoryCache()
+        cached = ProcessResult(
+            job_id="job-1", status=JobStatusType.PENDING, created_at=datetime(2024, 1, 15)
+        )
+        cache.set("key", cached)
+        return mock_service(handler, ClientConfig(cache=cache)), cache, cached
+
+    async def test_returns_current_status(self, mock_service):
+        service, cache, cached = self.make_service(mock_service, 200)
+
+        result = await service._refresh_cached(cache, cached)
+
+        assert result is not None
+        assert result.status == JobStatusType.COMPLETED
+        assert cache.get("key") is not None
+
+    async def test_file_hashed_off_event_loop(self, mock_service, monkeypatch, fake_pdf):
+        service, cache, cached = self.make_service(mock_service, 200)
+        cache.set(cache_key("digest", ProcessOptions()), cached)
+        hashed_in: list = []
+
+        def fake_digest(file):
+            hashed_in.append(threading.get_ident())
+            return "digest"
+
+        monkeypatch.setattr(ocr_module, "file_digest", fake_digest)
+
+        result = await service.process_file(fake_pdf)
+
+        assert result.job_id == "job-1"
+        assert hashed_in and hashed_in[0] != threading.get_ident()
+
+    async def test_failed_job_dropped(self, mock_service):
+        service, cache, cached = self.make_service(mock_service, 200, job_status="failed")
+
+        assert await service._refresh_cached(cache, cached) is None
+        assert cache.get("key") is None
+
+    async def test_missing_job_dropped(self, mock_service):
+        service, cache, cached = self.make_service(mock_service, 404)
+
+        assert await service._refresh_cached(cache, cached) is None
+        assert cache.get("key") is None
+
+
+class TestBoundedMultiJobWait:
+    """Tests for capping in-flight requests when waiting on many jobs."""
+
+    def make_service(self, mock_service):
+        def respond(request: httpx.Request) -> httpx.Response:
+            job_id = request.url.path.rsplit("/", 1)[-1]
+            # One body answers both status ("id") and result ("job_id") requests
+            return httpx.Response(
+                200,
+                json={
+                    **COMPLETED_RESULT,
+                    **SUBMITTED_JOB,
+                    "id": job_id,
+                    "job_id": job_id,
+                    "status": "completed",
+                    "total_pages": 1,
+                    "processed_pages": 1,
+                },
+            )
+
+        handler, in_flight = track_in_flight(respond)
+        return mock_service(handler), in_flight
+
+    async def test_wait_until_all_done_caps_requests(self, mock_service):
+        service, in_flight = self.make_service(mock_service)
+        job_ids = [f"job-{i}" for i in range(6)]
+
+        results = await service.wait_until_all_done(job_ids, max_concurrent=2)
+
+        assert [r.job_id for r in results] == job_ids
+        assert in_flight["peak"] == 2
+
+    async def test_iter_results_caps_requests(self, mock_service):
+        service, in_flight = self.make_service(mock_service)
+        job_ids = [f"job-{i}" for i in range(6)]
+
+        results = [r async for r in service.iter_results(job_ids, max_concurrent=3)]
+
+        assert sorted(r.job_id for r in results) == job_ids
+        assert in_flight["peak"] == 3
+
+    async def test_invalid_max_concurrent(self, service):
+        with pytest.raises(ValueError):
+            await service.wait_until_all_done(["job-1"], max_concurrent=0)
+
+
+class TestGetResults:
+    """Tests for parsing job results."""
+
+    async def test_parses_pages_and_pagination(self, mock_service):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "job_id": "job-1",
+                    "status": "completed",
+                    "pages": [{"page_number": 1, "result": "text", "id": "p1"}],
+                    "file_name": "doc.pdf",
+                    "total_pages": 3,
+                    "processed_pages": 3,
+                    "credits_used": 3,
+                    "model": "standard-v1",
+                    "result_format": "markdown",
+                    "completed_at": "2024-01-15T10:31:00Z",
+                    "pagination": {"page": 1, "limit": 1, "total": 3, "total_pages": 3},
+                },
+            )
+
+        service = mock_service(handler)
+
+        result = await service.get_results("job-1", limit=1)
+
+        assert result.file_name == "doc.pdf"
+        assert result.pages[0].id == "p1"
+        assert result.pagination == PaginationInfo(page=1, limit=1, total=3, total_pages=3)
+
+    async def test_pages_without_id_and_null_page_list(self, mock_service):
+        bodies = [
+            {**COMPLETED_RESULT, "pages": [{"page_number": 2, "result": {"total": 5}}]},
+            {**COMPLETED_RESULT, "pages": None},
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=bodies.pop(0))
+
+        service = mock_service(handler, ClientConfig(result_cache_size=0))
+
+        first = await service.get_results("job-1")
+        second = await service.get_results("job-1")
+
+        assert first.pages == [PageResult(page_number=2, result={"total": 5}, id=None)]
+        assert second.pages == []
+
+
+class TestResultCache:
+    """Tests for the in-memory cache of completed results."""
+
+    def make_service(self, mock_service, status="completed", **config_kwargs):
+        calls: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append((request.method, request.url.path))
+            if request.method == "DELETE":
+                return httpx.Response(200, json={"deleted": True})
+            job_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(
+                200, json={**COMPLETED_RESULT, "job_id": job_id, "status": status}
+            )
+
+        return mock_service(handler, ClientConfig(**config_kwargs)), calls
+
+    async def test_completed_result_fetched_once(self, mock_service):
+        service, calls = self.make_service(mock_service)
+
+        first = await service.get_results("job-1")
+        second = await service.get_results("job-1")
+
+        assert second == first
+        assert len(calls) == 1
+
+    async def test_callers_get_independent_copies(self, mock_service):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = {"page_number": 1, "result": "Invoice"}
+            return httpx.Response(200, json={**COMPLETED_RESULT, "pages": [page]})
+
+        service = mock_service(handler)
+
+        first = await service.get_results("job-1")
+        first.pages.clear()
+        first.credits_used = 0
+        second = await service.get_results("job-1")
+        second.pages.append(PageResult(page_number=2, result="Extra"))
+        third = await service.get_results("job-1")
+
+        assert third.pages == [PageResult(page_number=1, result="Invoice")]
+        assert third.credits_used == COMPLETED_RESULT["credits_used"]
+
+    async def test_other_page_not_shared(self, mock_service):
+        service, calls = self.make_service(mock_service)
+
+        await service.get_results("job-1", page=1)
+        await service.get_results("job-1", page=2)
+
+        assert len(calls) == 2
+
+    async def test_incomplete_result_not_cached(self, mock_service):
+        service, calls = self.make_service(mock_service, status="partially_done")
+
+        await service.get_results("job-1")
+        await service.get_results("job-1")
+
+        assert len(calls) == 2
+
+    async def test_least_recently_used_evicted(self, mock_service):
+        service, calls = self.make_service(mock_service, result_cache_size=2)
+
+        for job_id in ["job-1", "job-2", "job-1", "job-3", "job-1", "job-2"]:
+            await service.get_results(job_id)
+
+        # job-2 was evicted by job-3; job-1 stayed because it was used recently
+        assert [path for _, path in calls] == [
+            "/ocr/result/job-1",
+            "/ocr/result/job-2",
+            "/ocr/result/job-3",
+            "/ocr/result/job-2",
+        ]
+
+    async def test_disabled(self, mock_service):
+        service, calls = self.make_service(mock_service, result_cache_size=0)
+
+        await service.get_results("job-1")
+        await service.get_results("job-1")
+
+        assert len(calls) == 2
+
+    async def test_delete_job_evicts(self, mock_service):
+        service, calls = self.make_service(mock_service)
+
+        await service.get_results("job-1")
+        await service.delete_job("job-1")
+        await service.get_results("job-1")
+
+        assert [method for method, _ in calls] == ["GET", "DELETE", "GET"]
+
+
+class TestWaitUntilDone:
+    """Tests for waiting on a single job."""
+
+    def make_service(self, mock_service, statuses, result_codes, result_body=COMPLETED_RESULT):
+        """Serve statuses (processed_pages, status) and result codes in order."""
+        calls: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            kind = request.url.path.split("/")[2]
+            calls.append(kind)
+            if kind == "status":
+                processed, status = statuses.pop(0)
+                return httpx.Response(
+                    200,
+                    json={
+                        "id": "job-1",
+                        "status": status,
+                        "processed_pages": processed,
+                        "total_pages": 2,
+                        "created_at": "2024-01-15T10:30:00Z",
+                        "error_message": "merge failed" if status == "failed" else None,
+                    },
+                )
+            return httpx.Response(result_codes.pop(0), json=result_body)
+
+        return mock_service(handler), calls
+
+    async def test_polls_results_once_all_pages_processed(self, mock_service):
+        service, calls = self.make_service(
+            mock_service, [(1, "processing"), (2, "processing")], [202, 200]
+        )
+
+        result = await service.wait_until_done("job-1", PollOptions(poll_interval=0.001))
+
+        assert result.job_id == "job-1"
+        assert calls == ["status", "status", "result", "result"]
+
+    async def test_completed_status_fetches_results(self, mock_service):
+        service, calls = self.make_service(mock_service, [(2, "completed")], [200])
+
+        result = await service.wait_until_done("job-1", PollOptions(poll_interval=0.001))
+
+        assert result.status == JobStatusType.COMPLETED
+        assert calls == ["status", "result"]
+
+    @pytest.mark.parametrize(
+        ("result_codes", "result_body"),
+        [
+            ([404], COMPLETED_RESULT),
+            ([200], {**COMPLETED_RESULT, "status": "failed"}),
+            ([202] * 5, COMPLETED_RESULT),
+        ],
+        ids=["result-error", "result-failed", "stuck-finalizing"],
+    )
+    async def test_fails_after_all_pages_processed(self, mock_service, result_codes, result_body):
+        expected_calls = ["status", *["result"] * len(result_codes), "status"]
+        service, calls = self.make_service(
+            mock_service, [(2, "processing"), (2, "failed")], result_codes, result_body
+        )
+
+        with pytest.raises(JobFailedError, match="merge failed"):
+            await service.wait_until_done("job-1", PollOptions(poll_interval=0.001))
+
+        assert calls == expected_calls
+
+
+class TestProcessBatch:
+    """Tests for submitting several documents at once."""
+
+    def make_service(self, mock_service):
+        def respond(request: httpx.Request) -> httpx.Response:
+            url = json.loads(request.content)["url"]
+            return httpx.Response(
+                200, json={**SUBMITTED_JOB, "job_id": f"job-{url.rsplit('/', 1)[-1]}"}
+            )
+
+        handler, in_flight = track_in_flight(respond)
+        return mock_service(handler), in_flight
+
+    async def test_urls_submitted_concurrently_in_order(self, mock_service):
+        service, in_flight = self.make_service(mock_service)
+        urls = [f"https://example.com/{i}" for i in range(5)]
+
+        jobs = await service.process_batch(urls, max_concurrent=2)
+
+        assert [job.job_id for job in jobs] == [f"job-{i}" for i in range(5)]
+        assert in_flight["peak"] == 2
+
+    async def test_options_sent_with_every_url(self, mock_service):
+        bodies: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json=SUBMITTED_JOB)
+
+        service = mock_service(handler)
+        options = ProcessOptions(format=Format.MARKDOWN, model=Model.STANDARD_V1)
+
+        await service.process_batch(["https://example.com/a", "https://example.com/b"], options)
+
+        assert sorted(body["url"] for body in bodies) == [
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+        assert all(body["format"] == "markdown" for body in bodies)
+        assert all(body["model"] == Model.STANDARD_V1.value for body in bodies)
+
+    async def test_dedupe_urls_submits_each_url_once(self, mock_service):
+        bodies: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = json.loads(request.content)["url"]
+            bodies.append(url)
+            return httpx.Response(
+                200, json={**SUBMITTED_JOB, "job_id": f"job-{url.rsplit('/', 1)[-1]}"}
+            )
+
+        service = mock_service(handler)
+        urls = ["https://example.com/a", "https://example.com/b", "https://example.com/a"]
+
+        jobs = await service.process_batch(urls, dedupe_urls=True)
+
+        assert sorted(bodies) == ["https://example.com/a", "https://example.com/b"]
+        assert [job.job_id for job in jobs] == ["job-a", "job-b", "job-a"]
+        assert jobs[0] is jobs[2]
+
+    async def test_duplicate_urls_submitted_separately_by_default(self, mock_service):
+        service, _ = self.make_service(mock_service)
+
+        jobs = await service.process_batch(["https://example.com/a"] * 2)
+
+        assert len(jobs) == 2 and jobs[0] is not jobs[1]
+
+    async def test_files_routed_to_process_file(self, service, monkeypatch, tmp_path):
+        submitted: list = []
+
+        async def fake_process_file(file, options=None):
+            submitted.append(file)
+            return ProcessResult(
+                job_id="job-file", status=JobStatusType.PENDING, created_at=datetime(2024, 1, 15)
+            )
+
+        monkeypatch.setattr(service, "process_file", fake_process_file)
+        path = tmp_path / "doc.pdf"
+
+        jobs = await service.process_batch([path, str(path)])
+
+        assert submitted == [path, str(path)]
+        assert [job.job_id for job in jobs] == ["job-file", "job-file"]
+
+    async def test_errors_returned_at_source_index(self, mock_service, tmp_path):
+        service, _ = self.make_service(mock_service)
+        sources = ["https://example.com/0", tmp_path / "missing.pdf", "https://example.com/2"]
+
+        results = await service.process_batch(sources, return_exceptions=True)
+
+        assert isinstance(results[0], ProcessResult) and results[0].job_id == "job-0"
+        assert isinstance(results[1], FileError)
+        assert isinstance(results[2], ProcessResult) and results[2].job_id == "job-2"
+
+    async def test_errors_raised_by_default(self, service, tmp_path):
+        with pytest.raises(FileError, match="File not found"):
+            await service.process_batch([tmp_path / "missing.pdf"])
+
+    async def test_invalid_max_concurrent(self, service):
+        with pytest.raises(ValueError):
+            await service.process_batch(["https://example.com/a.pdf"], max_concurrent=0)
+
+
+class TestIsUrl:
+    """Tests for classifying batch sources."""
+
+    @pytest.mark.parametrize("source", ["https://example.com/a.pdf", "http://example.com/a.pdf"])
+    def test_url_strings(self, source):
+        assert _is_url(source)
+
+    @pytest.mark.parametrize(
+        "source",
+        ["invoice.pdf", "/tmp/https://a.pdf", "ftp://example.com/a.pdf", Path("https://x")],
+    )
+    def test_files(self, source):
+        assert not _is_url(source)
+
+    def test_file_object(self, fake_pdf):
+        assert not _is_url(fake_pdf)
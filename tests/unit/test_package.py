@@ -0,0 +1,30 @@
+"""Unit tests for the top-level leapocr package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import leapocr
+
+
+class TestLazyImports:
+    """Tests for PEP 562 lazy attribute loading."""
+
+    def test_import_does_not_load_client(self):
+        code = "import sys, leapocr; print('leapocr.client' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        assert output.strip() == "False"
+
+    def test_install_uvloop_does_not_load_httpx(self):
+        code = "import sys, leapocr; leapocr.install_uvloop; print('httpx' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        assert output.strip() == "False"
+
+    def test_all_names_resolve(self):
+        for name in leapocr.__all__:
+            assert getattr(leapocr, name) is not None
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            leapocr.DoesNotExist  # noqa: B018
@@ -0,0 +1,238 @@
+"""Unit tests for job status polling."""
+
+from datetime import datetime
+from typing import Optional
+
+import pytest
+
+from leapocr._internal import polling
+from leapocr._internal.polling import iter_completed, poll_many_until_done, poll_until_done
+from leapocr.errors import JobFailedError, JobTimeoutError
+from leapocr.models import JobStatus, JobStatusType, PollOptions
+
+
+def make_status(
+    status: JobStatusType, retry_after: Optional[float] = None, job_id: str = "job-123"
+) -> JobStatus:
+    now = datetime.now()
+    return JobStatus(
+        job_id=job_id,
+        status=status,
+        processed_pages=0,
+        total_pages=1,
+        progress=0.0,
+        created_at=now,
+        updated_at=now,
+        retry_after=retry_after,
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record poll delays instead of sleeping."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(polling.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock advanced by each (fake) sleep."""
+    now = [1000.0]
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(polling.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(polling.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def status_sequence(*statuses: JobStatus):
+    remaining = list(statuses)
+
+    async def get_status(job_id: str) -> JobStatus:
+        return remaining.pop(0)
+
+    return get_status
+
+
+class TestPollUntilDone:
+    """Tests for poll_until_done."""
+
+    async def test_returns_when_completed(self, sleeps):
+        get_status = status_sequence(
+            make_status(JobStatusType.PROCESSING),
+            make_status(JobStatusType.COMPLETED),
+        )
+
+        await poll_until_done(get_status, "job-123", PollOptions(poll_interval=1.5, jitter=0.0))
+
+        assert sleeps == [1.5]
+
+    async def test_raises_when_failed(self, sleeps):
+        get_status = status_sequence(make_status(JobStatusType.FAILED))
+
+        with pytest.raises(JobFailedError):
+            await poll_until_done(get_status, "job-123")
+
+    async def test_honors_retry_after(self, sleeps):
+        get_status = status_sequence(
+            make_status(JobStatusType.PROCESSING, retry_after=7.0),
+            make_status(JobStatusType.COMPLETED),
+        )
+
+        await poll_until_done(get_status, "job-123", PollOptions(poll_interval=1.0))
+
+        assert sleeps == [7.0]
+
+    async def test_async_progress_callback_awaited(self, sleeps):
+        seen: list[JobStatusType] = []
+
+        async def on_progress(status: JobStatus) -> None:
+            seen.append(status.status)
+
+        get_status = status_sequence(
+            make_status(JobStatusType.PROCESSING),
+            make_status(JobStatusType.COMPLETED),
+        )
+
+        await poll_until_done(get_status, "job-123", PollOptions(on_progress=on_progress))
+
+        assert seen == [JobStatusType.PROCESSING, JobStatusType.COMPLETED]
+
+    async def test_progress_callback_errors_ignored(self, sleeps):
+        async def on_progress(status: JobStatus) -> None:
+            raise RuntimeError("boom")
+
+        get_status = status_sequence(make_status(JobStatusType.COMPLETED))
+
+        await poll_until_done(get_status, "job-123", PollOptions(on_progress=on_progress))
+
+    async def test_backs_off_up_to_max_interval(self, sleeps):
+        get_status = status_sequence(
+            *[make_status(JobStatusType.PROCESSING)] * 4,
+            make_status(JobStatusType.COMPLETED),
+        )
+        options = PollOptions(
+            poll_interval=1.0, backoff_multiplier=2.0, max_interval=5.0, jitter=0.0
+        )
+
+        await poll_until_done(get_status, "job-123", options)
+
+        assert sleeps == [1.0, 2.0, 4.0, 5.0]
+
+    async def test_default_backoff_polls_long_job_less_often(self, clock):
+        polls: list[float] = []
+
+        async def get_status(job_id: str) -> JobStatus:
+            polls.append(sum(clock))
+            done = sum(clock) >= 30.0
+            return make_status(JobStatusType.COMPLETED if done else JobStatusType.PROCESSING)
+
+        await poll_until_done(get_status, "job-123", PollOptions(jitter=0.0))
+
+        # A fixed 2s interval would take 16 polls to see a 30s job finish
+        assert polls == [0.0, 2.0, 5.0, 9.5, 16.25, 26.25, 36.25]
+
+    async def test_jitter_bounds(self, sleeps):
+        get_status = status_sequence(
+            make_status(JobStatusType.PROCESSING),
+            make_status(JobStatusType.COMPLETED),
+        )
+
+        await poll_until_done(get_status, "job-123", PollOptions(poll_interval=2.0, jitter=0.5))
+
+        assert 2.0 <= sleeps[0] <= 3.0
+
+    async def test_times_out_at_deadline(self, clock):
+        async def get_status(job_id: str) -> JobStatus:
+            return make_status(JobStatusType.PROCESSING)
+
+        options = PollOptions(poll_interval=2.0, max_wait=5.0, jitter=0.0)
+        with pytest.raises(JobTimeoutError):
+            await poll_until_done(get_status, "job-123", options)
+
+        # 2 + 3 (backed off) reaches the deadline exactly, so no further poll is made
+        assert clock == [2.0, 3.0]
+
+    async def test_sleep_clamped_to_deadline(self, sleeps):
+        get_status = status_sequence(
+            make_status(JobStatusType.PROCESSING, retry_after=60.0),
+            make_status(JobStatusType.COMPLETED),
+        )
+
+        await poll_until_done(get_status, "job-123", PollOptions(max_wait=5.0))
+
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= 5.0
+
+
+def job_sequences(**sequences: list[JobStatusType]):
+    """Serve a separate status sequence per job and record every lookup."""
+    calls: list[str] = []
+
+    async def get_status(job_id: str) -> JobStatus:
+        calls.append(job_id)
+        return make_status(sequences[job_id].pop(0), job_id=job_id)
+
+    return get_status, calls
+
+
+class TestPollManyUntilDone:
+    """Tests for poll_many_until_done."""
+
+    async def test_shares_one_sleep_per_tick(self, sleeps):
+        get_status, calls = job_sequences(
+            a=[JobStatusType.PROCESSING, JobStatusType.COMPLETED],
+            b=[JobStatusType.PROCESSING, JobStatusType.PROCESSING, JobStatusType.COMPLETED],
+        )
+
+        await poll_many_until_done(
+            get_status,
+            ["a", "b"],
+            PollOptions(poll_interval=1.0, backoff_multiplier=2.0, jitter=0.0),
+        )
+
+        assert sleeps == [1.0, 2.0]
+        # Completed jobs are not polled again
+        assert calls == ["a", "b", "a", "b", "b"]
+
+    async def test_raises_when_any_job_fails(self, sleeps):
+        get_status, _ = job_sequences(
+            a=[JobStatusType.COMPLETED],
+            b=[JobStatusType.FAILED],
+        )
+
+        with pytest.raises(JobFailedError) as exc_info:
+            await poll_many_until_done(get_status, ["a", "b"])
+
+        assert exc_info.value.job_id == "b"
+
+    async def test_no_jobs(self, sleeps):
+        get_status, calls = job_sequences()
+
+        await poll_many_until_done(get_status, [])
+
+        assert calls == []
+        assert sleeps == []
+
+
+class TestIterCompleted:
+    """Tests for iter_completed."""
+
+    async def test_yields_in_completion_order(self, sleeps):
+        get_status, _ = job_sequences(
+            a=[JobStatusType.PROCESSING, JobStatusType.PROCESSING, JobStatusType.COMPLETED],
+            b=[JobStatusType.PROCESSING, JobStatusType.COMPLETED],
+        )
+
+        done = [job_id async for job_id in iter_completed(get_status, ["a", "b"])]
+
+        assert done == ["b", "a"]
@@ -0,0 +1,79 @@
+"""Unit tests for client-side rate limiting."""
+
+import pytest
+
+from leapocr._internal import rate_limit
+from leapocr._internal.rate_limit import TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock advanced by each (fake) sleep, so pacing costs no real time.
+
+    Tests use power-of-two rates so token arithmetic on the fake clock is exact.
+    """
+    now = [0.0]
+
+    async def fake_sleep(delay: float) -> None:
+        now[0] += delay
+
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+    return now
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_default_capacity(self):
+        assert TokenBucket(rate=5.0).capacity == 5.0
+        assert TokenBucket(rate=0.5).capacity == 1.0
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1.0, capacity=0.5)
+
+    async def test_burst_within_capacity(self, clock):
+        """Requests up to capacity are not delayed."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        start = clock[0]
+        for _ in range(3):
+            await bucket.acquire()
+
+        assert clock[0] == start
+
+    async def test_paces_beyond_capacity(self, clock):
+        """Requests beyond capacity wait for tokens to refill."""
+        bucket = TokenBucket(rate=16.0, capacity=1)
+
+        start = clock[0]
+        for _ in range(3):
+            await bucket.acquire()
+
+        # Two refills at 16 tokens/sec take 0.125s
+        assert clock[0] - start == 0.125
+
+    async def test_pause_delays_next_token(self, clock):
+        bucket = TokenBucket(rate=128.0, capacity=5)
+        bucket.pause(0.125)
+
+        start = clock[0]
+        await bucket.acquire()
+
+        # The pause, then one token refill at 128 tokens/sec
+        assert clock[0] - start == 0.125 + 1 / 128
+
+    async def test_drain_discards_burst(self, clock):
+        bucket = TokenBucket(rate=16.0, capacity=5)
+        bucket.drain()
+
+        start = clock[0]
+        await bucket.acquire()
+
+        # One token refill at 16 tokens/sec
+        assert clock[0] - start == 1 / 16
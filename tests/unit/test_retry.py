@@ -0,0 +1,104 @@
+"""Unit tests for retry with exponential backoff."""
+
+import httpx
+import pytest
+
+from leapocr._internal import retry
+from leapocr._internal.retry import is_retryable_error, with_retry
+from leapocr.errors import (
+    APIError,
+    AuthenticationError,
+    JobTimeoutError,
+    NetworkError,
+    RateLimitError,
+    ValidationError,
+)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays: list = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def failing(errors, result="ok"):
+    """Build an operation that raises each error in turn, then succeeds."""
+    remaining = list(errors)
+
+    async def operation():
+        if remaining:
+            raise remaining.pop(0)
+        return result
+
+    return operation
+
+
+class TestIsRetryableError:
+    """Tests for classifying errors as retryable."""
+
+    @pytest.mark.parametrize(
+        ("error", "retryable"),
+        [
+            (RateLimitError("slow down"), True),
+            (APIError("unavailable", status_code=503), True),
+            (NetworkError("connection reset"), True),
+            (httpx.ConnectTimeout("timed out"), True),
+            (APIError("not found", status_code=404), False),
+            (ValidationError("bad"), False),
+            (AuthenticationError("bad key"), False),
+            (JobTimeoutError("too slow", job_id="job-1"), False),
+            (ValueError("bug"), False),
+        ],
+        ids=lambda value: type(value).__name__ if isinstance(value, Exception) else None,
+    )
+    def test_classification(self, error, retryable):
+        assert is_retryable_error(error) is retryable
+
+
+class TestWithRetry:
+    """Tests for with_retry."""
+
+    async def test_backoff_with_jitter(self, sleeps):
+        errors = [APIError("unavailable", status_code=503)] * 3
+        result = await with_retry(failing(errors), retry_delay=1.0, retry_multiplier=2.0)
+
+        assert result == "ok"
+        assert len(sleeps) == 3
+        for delay, base in zip(sleeps, [1.0, 2.0, 4.0]):
+            assert base <= delay <= base * 1.1
+
+    async def test_no_jitter(self, sleeps):
+        errors = [APIError("unavailable", status_code=503)] * 2
+        await with_retry(failing(errors), retry_delay=0.5, jitter=0.0)
+
+        assert sleeps == [0.5, 1.0]
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            RateLimitError("slow down", retry_after=7),
+            APIError("unavailable", status_code=503, retry_after=7.0),
+        ],
+    )
+    async def test_server_retry_after_wins(self, sleeps, error):
+        await with_retry(failing([error]), retry_delay=1.0)
+
+        assert sleeps == [7.0]
+
+    async def test_non_retryable_raised_immediately(self, sleeps):
+        with pytest.raises(ValidationError):
+            await with_retry(failing([ValidationError("bad")]))
+
+        assert sleeps == []
+
+    async def test_raises_after_max_retries(self, sleeps):
+        errors = [APIError("unavailable", status_code=503)] * 3
+        with pytest.raises(APIError):
+            await with_retry(failing(errors), max_retries=2)
+
+        assert len(sleeps) == 2
@@ -0,0 +1,17 @@
+"""Unit tests for JSON serialization helpers."""
+
+from leapocr._internal.serialization import dumps, loads
+
+
+class TestSerialization:
+    """Tests for dumps/loads."""
+
+    def test_dumps_returns_compact_bytes(self):
+        assert dumps({"a": 1, "b": [1, 2]}) == b'{"a":1,"b":[1,2]}'
+
+    def test_dumps_keeps_unicode(self):
+        assert loads(dumps({"text": "Grüße"})) == {"text": "Grüße"}
+
+    def test_loads_accepts_bytes_and_str(self):
+        assert loads(b'{"ok": true}') == {"ok": True}
+        assert loads('{"ok": true}') == {"ok": True}
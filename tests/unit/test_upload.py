@@ -0,0 +1,121 @@
+"""Unit tests for multipart uploads."""
+
+import io
+
+import httpx
+import pytest
+
+from leapocr._internal import upload
+from leapocr._internal.upload import STREAM_CHUNK_SIZE, MultipartUploader, _read_range
+from leapocr.errors import FileError, NetworkError
+
+
+def make_parts(size: int, part_size: int) -> list[dict]:
+    return [
+        {
+            "part_number": i + 1,
+            "start_byte": start,
+            "end_byte": min(start + part_size, size) - 1,
+            "upload_url": f"https://storage.example.com/upload?partNumber={i + 1}",
+        }
+        for i, start in enumerate(range(0, size, part_size))
+    ]
+
+
+@pytest.fixture
+def received():
+    """Bodies received by the fake storage server, keyed by part number."""
+    return {}
+
+
+@pytest.fixture
+async def uploader(received):
+    def handler(request: httpx.Request) -> httpx.Response:
+        part_number = int(request.url.params["partNumber"])
+        received[part_number] = request.read()
+        assert int(request.headers["Content-Length"]) == len(received[part_number])
+        return httpx.Response(200, headers={"ETag": f'"etag-{part_number}"'})
+
+    uploader = MultipartUploader()
+    await uploader.close()
+    uploader._s3_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    yield uploader
+    await uploader.close()
+
+
+class TestMultipartUploader:
+    """Tests for MultipartUploader."""
+
+    async def test_uploads_parts(self, uploader, received):
+        data = bytes(range(256)) * 1000
+        parts = make_parts(len(data), 100_000)
+
+        completed = await uploader.upload_multipart(io.BytesIO(data), parts)
+
+        assert completed == [
+            {"part_number": 1, "etag": "etag-1"},
+            {"part_number": 2, "etag": "etag-2"},
+            {"part_number": 3, "etag": "etag-3"},
+        ]
+        assert b"".join(received[n] for n in sorted(received)) == data
+
+    async def test_streams_part_larger_than_chunk(self, uploader, received):
+        data = b"x" * (STREAM_CHUNK_SIZE * 3 + 17)
+
+        await uploader.upload_multipart(io.BytesIO(data), make_parts(len(data), len(data)))
+
+        assert received[1] == data
+
+    async def test_uploads_real_file(self, uploader, received, tmp_path):
+        data = bytes(range(256)) * 1000
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(data)
+
+        with open(path, "rb") as f:
+            f.seek(123)
+            await uploader.upload_multipart(f, make_parts(len(data), 100_000))
+            # pread leaves the file position untouched
+            assert f.tell() == 123
+
+        assert b"".join(received[n] for n in sorted(received)) == data
+
+    async def test_short_real_file_raises_file_error(self, uploader, tmp_path):
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"x" * 10)
+
+        with open(path, "rb") as f, pytest.raises(FileError):
+            await uploader.upload_multipart(f, make_parts(1000, 1000))
+
+    async def test_custom_chunk_size(self, uploader, received, monkeypatch):
+        chunks: list = []
+        data = b"y" * 1000
+        uploader.chunk_size = 128
+
+        async def spy(file, start, length, part_number, chunk_size):
+            async for chunk in _read_range(file, start, length, part_number, chunk_size):
+                chunks.append(len(chunk))
+                yield chunk
+
+        monkeypatch.setattr(upload, "_read_range", spy)
+        await uploader.upload_multipart(io.BytesIO(data), make_parts(len(data), len(data)))
+
+        assert received[1] == data
+        assert max(chunks) == 128
+
+    async def test_short_file_raises_file_error(self, uploader):
+        parts = make_parts(1000, 1000)
+
+        with pytest.raises(FileError):
+            await uploader.upload_multipart(io.BytesIO(b"x" * 10), parts)
+
+    async def test_missing_etag_raises_network_error(self):
+        uploader = MultipartUploader()
+        await uploader.close()
+        uploader._s3_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200))
+        )
+
+        with pytest.raises(NetworkError):
+            await uploader.upload_multipart(io.BytesIO(b"data"), make_parts(4, 4))
+
+        await uploader.close()
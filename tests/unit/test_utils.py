@@ -1,8 +1,19 @@
 """Unit tests for utility functions."""
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 
-from leapocr._internal.utils import calculate_progress, parse_datetime
+import pytest
+
+from leapocr._internal.utils import (
+    calculate_progress,
+    gather_or_cancel,
+    parse_datetime,
+    parse_job_status,
+    parse_retry_after,
+    shared_ssl_context,
+)
+from leapocr.models import JobStatusType
 
 
 class TestParseDatetime:
@@ -55,58 +66,45 @@ class TestParseDatetime:
         assert isinstance(result, datetime)
         assert result.year == 2024
 
-    def test_parse_datetime_always_returns_datetime(self):
-        """Ensure parse_datetime never returns None."""
-        test_cases = [
+    def test_repeated_strings_parsed_once(self):
+        first = parse_datetime("2024-01-15T10:30:00Z")
+
+        assert parse_datetime("2024-01-15T10:30:00Z") is first
+        assert first == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
             "2024-01-15T10:30:00Z",
             "invalid",
             None,
             "",
             "2024-13-45T99:99:99Z",  # Invalid date
-        ]
-
-        for test_input in test_cases:
-            result = parse_datetime(test_input)
-            assert isinstance(result, datetime), f"Failed for input: {test_input}"
+        ],
+    )
+    def test_parse_datetime_always_returns_datetime(self, value):
+        """Ensure parse_datetime never returns None."""
+        assert isinstance(parse_datetime(value), datetime)
 
 
 class TestCalculateProgress:
     """Tests for progress calculation."""
 
-    def test_normal_progress(self):
-        """Test normal progress calculation."""
-        status_data = {"processed_pages": 5, "total_pages": 10}
-        assert calculate_progress(status_data) == 50.0
-
-    def test_zero_progress(self):
-        """Test zero progress."""
-        status_data = {"processed_pages": 0, "total_pages": 10}
-        assert calculate_progress(status_data) == 0.0
-
-    def test_complete_progress(self):
-        """Test 100% progress."""
-        status_data = {"processed_pages": 10, "total_pages": 10}
-        assert calculate_progress(status_data) == 100.0
-
-    def test_no_total_pages(self):
-        """Test with zero total pages."""
-        status_data = {"processed_pages": 0, "total_pages": 0}
-        assert calculate_progress(status_data) == 0.0
-
-    def test_missing_processed_pages(self):
-        """Test with missing processed_pages key."""
-        status_data = {"total_pages": 10}
-        assert calculate_progress(status_data) == 0.0
-
-    def test_missing_total_pages(self):
-        """Test with missing total_pages key."""
-        status_data = {"processed_pages": 5}
-        assert calculate_progress(status_data) == 0.0
-
-    def test_empty_status_data(self):
-        """Test with empty status data."""
-        status_data = {}
-        assert calculate_progress(status_data) == 0.0
+    @pytest.mark.parametrize(
+        ("status_data", "expected"),
+        [
+            pytest.param({"processed_pages": 5, "total_pages": 10}, 50.0, id="normal"),
+            pytest.param({"processed_pages": 0, "total_pages": 10}, 0.0, id="zero"),
+            pytest.param({"processed_pages": 10, "total_pages": 10}, 100.0, id="complete"),
+            pytest.param({"processed_pages": 0, "total_pages": 0}, 0.0, id="no-total-pages"),
+            pytest.param({"total_pages": 10}, 0.0, id="missing-processed-pages"),
+            pytest.param({"processed_pages": 5}, 0.0, id="missing-total-pages"),
+            pytest.param({}, 0.0, id="empty"),
+            pytest.param({"processed_pages": 5000, "total_pages": 10000}, 50.0, id="large"),
+        ],
+    )
+    def test_progress(self, status_data, expected):
+        assert calculate_progress(status_data) == expected
 
     def test_progress_clamped_to_100(self):
         """Test that progress is clamped to maximum 100."""
@@ -128,7 +126,81 @@ class TestCalculateProgress:
         progress = calculate_progress(status_data)
         assert 33.0 < progress < 34.0  # Should be approximately 33.33%
 
-    def test_large_numbers(self):
-        """Test with large page counts."""
-        status_data = {"processed_pages": 5000, "total_pages": 10000}
-        assert calculate_progress(status_data) == 50.0
+
+class TestParseJobStatus:
+    """Tests for parse_job_status."""
+
+    @pytest.mark.parametrize("status", list(JobStatusType))
+    def test_every_status(self, status):
+        assert parse_job_status(status.value) is status
+
+    def test_unknown_status(self):
+        with pytest.raises(ValueError):
+            parse_job_status("exploded")
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_delay_seconds(self):
+        assert parse_retry_after("30") == 30.0
+
+    def test_fractional_seconds(self):
+        assert parse_retry_after("1.5") == 1.5
+
+    def test_negative_clamped(self):
+        assert parse_retry_after("-5") == 0.0
+
+    def test_missing(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+
+    def test_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid(self):
+        assert parse_retry_after("soon") is None
+
+    @pytest.mark.parametrize("value", ["inf", "-inf", "nan", "1e999"])
+    def test_non_finite_rejected(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestSharedSSLContext:
+    """Tests for the shared TLS context."""
+
+    def test_context_is_reused(self):
+        assert shared_ssl_context() is shared_ssl_context()
+
+    def test_separate_context_for_http2(self):
+        assert shared_ssl_context(True) is not shared_ssl_context(False)
+
+
+class TestGatherOrCancel:
+    """Tests for concurrent runs that cancel siblings on failure."""
+
+    async def test_results_in_order(self):
+        async def value(v: int, delay: float) -> int:
+            await asyncio.sleep(delay)
+            return v
+
+        assert await gather_or_cancel(value(1, 0.02), value(2, 0.0)) == [1, 2]
+
+    async def test_failure_cancels_siblings(self):
+        cancelled = asyncio.Event()
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await gather_or_cancel(slow(), fail())
+
+        # Siblings are cancelled and finished before the error propagates
+        assert cancelled.is_set()
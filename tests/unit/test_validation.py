@@ -1,10 +1,13 @@
 """Unit tests for validation functions."""
 
+import io
+
 from leapocr._internal.validation import (
     MAX_FILE_SIZE,
     MAX_INSTRUCTIONS_LENGTH,
     SUPPORTED_EXTENSIONS,
     ValidationResult,
+    get_file_size,
     guess_content_type,
     validate_file,
     validate_instructions,
@@ -47,7 +50,7 @@ class TestValidateFile:
 
         result = validate_file(test_file)
         assert result.valid is False
-        assert "not found" in result.error.lower()
+        assert "File not found" in result.error
 
     def test_unsupported_extension(self, tmp_path):
         """Test validation of unsupported file type."""
@@ -56,7 +59,7 @@ class TestValidateFile:
 
         result = validate_file(test_file)
         assert result.valid is False
-        assert "unsupported file type" in result.error.lower()
+        assert "Unsupported file type" in result.error
 
     def test_no_extension(self, tmp_path):
         """Test validation of file without extension."""
@@ -65,7 +68,7 @@ class TestValidateFile:
 
         result = validate_file(test_file)
         assert result.valid is False
-        assert "unsupported" in result.error.lower()
+        assert "Unsupported file type" in result.error
 
     def test_file_too_large(self, tmp_path):
         """Test validation of file exceeding size limit."""
@@ -87,7 +90,7 @@ class TestValidateFile:
         assert result.valid is True
         assert result.warnings is not None
         assert len(result.warnings) > 0
-        assert "multipart" in result.warnings[0].lower()
+        assert "multipart upload" in result.warnings[0]
 
     def test_empty_file(self, tmp_path):
         """Test validation of empty file."""
@@ -96,7 +99,7 @@ class TestValidateFile:
 
         result = validate_file(test_file)
         assert result.valid is False
-        assert "empty" in result.error.lower()
+        assert result.error == "File is empty"
 
     def test_directory_instead_of_file(self, tmp_path):
         """Test validation when path is a directory."""
@@ -105,7 +108,30 @@ class TestValidateFile:
 
         result = validate_file(test_dir)
         assert result.valid is False
-        assert "not a file" in result.error.lower()
+        assert "Not a file" in result.error
+
+
+class TestGetFileSize:
+    """Tests for file size detection."""
+
+    def test_path(self, tmp_path):
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"x" * 123)
+        assert get_file_size(path) == 123
+
+    def test_real_file_keeps_position(self, tmp_path):
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"x" * 123)
+        with open(path, "rb") as f:
+            f.seek(10)
+            assert get_file_size(f) == 123
+            assert f.tell() == 10
+
+    def test_in_memory_file(self):
+        buffer = io.BytesIO(b"x" * 50)
+        buffer.seek(5)
+        assert get_file_size(buffer) == 50
+        assert buffer.tell() == 5
 
 
 class TestValidateInstructions:
@@ -133,7 +159,7 @@ class TestValidateInstructions:
         instructions = "a" * (MAX_INSTRUCTIONS_LENGTH + 1)
         result = validate_instructions(instructions)
         assert result.valid is False
-        assert "too long" in result.error.lower()
+        assert "Instructions too long" in result.error
 
     def test_instructions_with_unicode(self):
         """Unicode characters in instructions."""
@@ -174,3 +200,7 @@ class TestConstants:
     def test_supported_extensions(self):
         assert ".pdf" in SUPPORTED_EXTENSIONS
         assert len(SUPPORTED_EXTENSIONS) >= 1
+
+    def test_supported_extensions_is_immutable(self):
+        # Shared default for every validate_file() call, so it must not be mutable
+        assert isinstance(SUPPORTED_EXTENSIONS, frozenset)